@@ -0,0 +1,126 @@
+# Backend/AppIndex.py
+
+import json
+import os
+import threading
+from collections import Counter, defaultdict
+from time import time
+
+
+def NormalizeName(name):
+    return " ".join(str(name).lower().replace(".", " ").split())
+
+
+def Trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class AppIndex:
+    """Persistent name -> target index used by OpenApp.
+
+    Holds the installed apps reported by AppOpener and the known web-app aliases.
+    Exact names are a dict lookup; anything else goes through a trigram inverted
+    index, so only names sharing trigrams with the query are scored, however
+    many entries there are.
+    """
+
+    RefreshInterval = 24 * 60 * 60
+    MatchThreshold = 0.6
+    MaxCandidates = 25
+
+    def __init__(self, path, web_apps):
+        self.path = path
+        self.web_apps = web_apps
+        self.lock = threading.Lock()
+        self.apps = []
+        self.refreshed_at = 0
+        self.entries = {}
+        self.postings = defaultdict(list)
+        self.refresh_thread = None
+        self.load()
+        self.rebuild()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            self.apps = data.get("apps", [])
+            self.refreshed_at = data.get("refreshed_at", 0)
+        except Exception:
+            pass
+
+    def save(self):
+        temp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({"apps": self.apps, "refreshed_at": self.refreshed_at}, file, indent=4)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"[ERROR] Saving app index failed: {e}")
+
+    def rebuild(self):
+        """Recompute the lookup tables; installed apps win over web aliases"""
+        entries = {}
+        for name, url in self.web_apps.items():
+            entries[NormalizeName(name)] = {"kind": "web", "target": url}
+        for name in self.apps:
+            entries[NormalizeName(name)] = {"kind": "app", "target": name}
+
+        postings = defaultdict(list)
+        for key in entries:
+            for gram in Trigrams(key):
+                postings[gram].append(key)
+
+        with self.lock:
+            self.entries = entries
+            self.postings = postings
+
+    def resolve(self, name):
+        """Best indexed target for a spoken name, or None"""
+        key = NormalizeName(name)
+        with self.lock:
+            entries = self.entries
+            postings = self.postings
+
+        if key in entries:
+            return entries[key]
+
+        grams = Trigrams(key)
+        shared = Counter()
+        for gram in grams:
+            shared.update(postings.get(gram, ()))
+        if not shared:
+            return None
+
+        # Dice coefficient over trigram sets, only for the names sharing the most trigrams
+        best_key, best_score = None, 0.0
+        for candidate, count in shared.most_common(self.MaxCandidates):
+            score = 2 * count / (len(grams) + len(Trigrams(candidate)))
+            if score > best_score:
+                best_key, best_score = candidate, score
+
+        if best_score >= self.MatchThreshold:
+            return entries[best_key]
+        return None
+
+    def refresh_installed_apps(self):
+        try:
+            from AppOpener import give_appnames
+            self.apps = sorted(str(name) for name in give_appnames())
+        except Exception as e:
+            print(f"[ERROR] Listing installed apps failed: {e}")
+            return
+        self.refreshed_at = time()
+        self.rebuild()
+        self.save()
+
+    def start_background_refresh(self):
+        """Refresh the installed-app list off the calling thread if it is missing or stale"""
+        if time() - self.refreshed_at < self.RefreshInterval:
+            return
+        if self.refresh_thread is not None and self.refresh_thread.is_alive():
+            return
+        self.refresh_thread = threading.Thread(target=self.refresh_installed_apps, daemon=True)
+        self.refresh_thread.start()
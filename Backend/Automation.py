@@ -1,7 +1,7 @@
 from AppOpener import close, open as appopen
 from webbrowser import open as webopen
-from pywhatkit import search, playonyt
-from dotenv import dotenv_values
+from pywhatkit import search
+from Backend.Config import config
 from bs4 import BeautifulSoup
 from rich import print
 from groq import Groq
@@ -9,9 +9,19 @@ import webbrowser
 import subprocess
 import requests
 import keyboard
-import asyncio
+import re
+from collections import deque
+from urllib.parse import quote_plus
 import os
 from Backend.TextToSpeech import TextToSpeech as speak
+from Backend.AppIndex import AppIndex
+from Backend.TargetCache import TargetCache, MISS
+from Backend.Scheduler import AutomationScheduler, OK
+from Backend.Commands import BuildTasks
+from Backend.ScreenMatch import TemplateLocator, WaitForWindow, ActiveWindowTitle
+from Backend.Contacts import ContactResolver
+from Backend.Reminders import SetReminder
+from Backend.db import ContactsDB, NormalizeNumber
 import sys
 from shlex import quote
 import pyttsx3
@@ -27,21 +37,26 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
-env_vars = dotenv_values(resource_path(".env"))
-GroqAPIKey = env_vars.get("GroqAPIKey")
-
 classes = ["zCubwf", "hgKElc", "LTKOO sY7ric", "ZOLcW", "gsrt vk_bk FzvWSb YwPhnf", "pclqee", "tw-Data-text tw-text-small tw-ta", "IZ6rdc", "05uR6d LTKOO", "vlzY6d", "webanswers-webanswers_table_webanswers-table", "dDoNo ikb4Bb gsrt", "sXLa0e",
 "LWkFKe", "VQF4g", "qv3Wpe", "kno-rdesc", "SPZz6b"]
 
 useragent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.75 Safari/537.36"
 
-client = Groq(api_key=GroqAPIKey)
+# Groq client for content writing, created by the first Content request
+client = None
+
+def GroqClient():
+    global client
+    if client is None:
+        client = Groq(api_key=config.get("GroqAPIKey"))
+    return client
 
 professional_responses = [
     "Your satisfaction is my top priority; feel free to reach out if there's anything else I can help you with.",
     "I'm at your service for any additional questions or support you may need-don't hesitate to ask.",
 ]
-messages = []
+# Earlier content exchanges sent along with a new request; off unless ContentHistory > 0
+messages = deque(maxlen=2 * config.get("ContentHistory"))
 
 SystemChatBot = [{"role": "system", "content": f"Hello, I am {os.environ['Username']}, You're a content writer. You have to write content like letters, codes, applications, essays, notes, songs, poems, etc."}]
 
@@ -49,98 +64,147 @@ def GoogleSearch(Topic):
     search(Topic)
     return True
 
-# Function to generate content using AI and save it to a file.
-def Content(Topic):
+# Editor for generated content; one that reloads changed files shows the text as it streams in
+ContentEditor = config.get("ContentEditor")
+# Editors known to pick up changes to an open file; any other editor (Notepad included)
+# is only started once the whole answer has been written
+LiveReloadEditors = {"code", "code.exe", "notepad++", "notepad++.exe", "subl", "subl.exe", "sublime_text.exe"}
 
-    #Nested function to open a file in Notepad.
-    def OpenNotepad(File):
-        default_text_editor = 'notepad.exe'
-        subprocess.Popen([default_text_editor, File]) # Open the file in Notepad.
-
-    # Nested function to generate content using the Al chatbot.
-    def ContentWriterAI(prompt):
-        messages.append({"role": "user", "content": f"{prompt}"})  # Add the user's prompt to messages
-        from groq  import Groq#Import Groq for Al chat functionalities.
-        #Initialize the Grog client with the API key.
-        client = Groq(api_key=GroqAPIKey)
-
-        completion = client.chat.completions.create(
-            model="gemma2-9b-it",  # Specify the AI model
-            messages=SystemChatBot + messages,  # Include system instructions and chat history
-            max_tokens=2048,  # Limit the maximum tokens in the response
-            temperature=0.7,  # Adjust response randomness
-            top_p=1,  # Use nucleus sampling for response diversity
-            stream=True,  # Enable streaming response
-            stop=None  # Allow the model to determine stopping conditions
-        )
+def ApplySettings(changes):
+    """New key, editor or history length; the history keeps its most recent exchanges"""
+    global client, messages, ContentEditor
 
-        Answer = ""  # Initialize an empty string for the response
+    if "GroqAPIKey" in changes:
+        client = None
+    if "ContentHistory" in changes:
+        messages = deque(messages, maxlen=2 * config.get("ContentHistory"))
+    ContentEditor = config.get("ContentEditor")
 
-        # Process streamed response chunks
-        for chunk in completion:
-            if chunk.choices[0].delta.content:
-                Answer += chunk.choices[0].delta.content  # Append content to the response
+config.subscribe(("GroqAPIKey", "ContentHistory", "ContentEditor"), ApplySettings)
 
-        Answer = Answer.replace("</s>", "")  # Remove unwanted tokens from the response
-        messages.append({"role": "assistant", "content": Answer})  # Add the AI's response to messages
-        return Answer
+# Function to generate content using AI and stream it into a file.
+def Content(Topic):
 
-        
-    Topic = Topic.replace("Content ", "") # Remove "Content from the topic. 
-    ContentByAI = ContentWriterAI(Topic) # Generate content using AI.
+    #Nested function to open a file in the editor.
+    def OpenNotepad(File):
+        subprocess.Popen([ContentEditor, File]) # Open the file in the editor.
 
-    # Save the generated content to a text file.
-    with open(resource_path(rf"Data\{Topic.lower().replace(' ','_')}.txt"), "w", encoding="utf-8") as file: 
-        file.write(ContentByAI) # Write the content to the file.
-        file.close()
-    
-    OpenNotepad(resource_path(rf"Data\{Topic.lower().replace(' ','_')}.txt")) # Open the file in Notepad. 
+    Topic = Topic.replace("Content ", "") # Remove "Content from the topic. 
+    File = resource_path(rf"Data\{Topic.lower().replace(' ','_')}.txt")
+
+    # Each request sends only its own prompt, plus the last ContentHistory exchanges if enabled
+    prompt = {"role": "user", "content": f"{Topic}"}
+    completion = GroqClient().chat.completions.create(
+        model="gemma2-9b-it",  # Specify the AI model
+        messages=SystemChatBot + list(messages) + [prompt],  # System instructions, bounded history and this prompt
+        max_tokens=2048,  # Limit the maximum tokens in the response
+        temperature=0.7,  # Adjust response randomness
+        top_p=1,  # Use nucleus sampling for response diversity
+        stream=True,  # Enable streaming response
+        stop=None  # Allow the model to determine stopping conditions
+    )
+
+    Answer = []
+    # A live-reloading editor opens with the first chunk and follows the file as it grows
+    opened = False
+    live = os.path.basename(ContentEditor).lower() in LiveReloadEditors
+
+    # Write each chunk as it arrives
+    with open(File, "w", encoding="utf-8") as file:
+        for chunk in completion:
+            text = chunk.choices[0].delta.content
+            if not text:
+                continue
+            text = text.replace("</s>", "")  # Remove unwanted tokens from the response
+            Answer.append(text)
+            file.write(text)
+            file.flush()
+            if live and not opened:
+                OpenNotepad(File)
+                opened = True
+
+    if not opened:
+        OpenNotepad(File)
+
+    if messages.maxlen:
+        messages.append(prompt)
+        messages.append({"role": "assistant", "content": "".join(Answer)})
     return True # Indicate success.
 
+# Query -> URL results of the YouTube and Google scrapes, so repeated commands open straight away
+target_cache = TargetCache(resource_path("Data/TargetCache.json"))
+scrape_session = requests.Session()
+
 def YoutubeSearch(Topic):
-    Url4Search = f"https://www.youtube.com/results?search_query={Topic}"
+    Url4Search = f"https://www.youtube.com/results?search_query={quote_plus(Topic)}"
     webbrowser.open(Url4Search)
     return True
 
+def ResolveYoutubeVideo(query):
+    """URL of the first video in YouTube's results for query, None if there is none, MISS if the request failed"""
+    try:
+        response = scrape_session.get(
+            f"https://www.youtube.com/results?search_query={quote_plus(query)}",
+            headers={"User-Agent": useragent}, timeout=10
+        )
+        match = re.search(r'"videoId":"([\w-]{11})"', response.text) or re.search(r"watch\?v=([\w-]{11})", response.text)
+        return f"https://www.youtube.com/watch?v={match.group(1)}" if match else None
+    except Exception as e:
+        print(f"[ERROR] YouTube search failed: {e}")
+        return MISS
+
 def PlayYoutube(query):
-    playonyt(query)
+    url = target_cache.get("youtube", query)
+    if url is MISS:
+        url = ResolveYoutubeVideo(query)
+        if url is not MISS:
+            target_cache.put("youtube", query, url)
+
+    if url is None or url is MISS:
+        print(f"[WARNING] No video found for '{query}'")
+        return YoutubeSearch(query)
+
+    webbrowser.open(url)
     return True
 
 import requests
 from bs4 import BeautifulSoup
 from AppOpener import open as appopen
 from webbrowser import open as webopen
-import sqlite3
 
 
 
 
 
-def findContact(query):    
-    con = sqlite3.connect("jarvis.db")
-    cursor = con.cursor()
+# One open connection and name index shared by every WhatsApp command
+contact_resolver = ContactResolver(ContactsDB)
+
+def findContact(query):
     try:
-        query = query.strip().split(' ')
-        query = query[0]
-        query = query.replace('.', '')
-        query = query.strip().lower()
-        cursor.execute("SELECT mobile_no FROM contacts WHERE LOWER(name) LIKE ? OR LOWER(name) LIKE ?", ('%' + query + '%', query + '%'))
-        results = cursor.fetchall()
-        print(results[0][0])
-        mobile_number_str = str(results[0][0])
-
-        if not mobile_number_str.startswith('+91'):
-            mobile_number_str = '+91' + mobile_number_str
-        con.close()
-        return mobile_number_str, query
+        match = contact_resolver.resolve(query.replace('.', ''))
+        if match is None:
+            print(f"No contact matches '{query}'")
+            return 0, 0
+
+        score, contact_name, mobile_no, name = match
+        print(f"{contact_name}: {mobile_no} ({score:.2f})")
+        # The resolver returns the stored E.164 number; anything it couldn't normalize is dialled as saved
+        mobile_number_str = NormalizeNumber(mobile_no) or str(mobile_no)
+        return mobile_number_str, name
     except Exception as e:
         print(e)
-        con.close()
         return 0, 0
 
 
 useragent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
 
+# Seconds to wait for the WhatsApp window and its chat header
+WHATSAPP_TIMEOUT = 15
+# Sending only needs the chat loaded; never wait longer than the old fixed 5 s sleep for it
+WHATSAPP_MESSAGE_TIMEOUT = 5
+voice_call_button = TemplateLocator(resource_path("Frontend/Graphics/voice_call.png"))
+video_call_button = TemplateLocator(resource_path("Frontend/Graphics/video_call.png"))
+
 def whatsApp(mobile_no, message, flag, name):
     jarvis_message = ""
 
@@ -157,38 +221,34 @@ def whatsApp(mobile_no, message, flag, name):
     whatsapp_url = f"whatsapp://send?phone={mobile_no}&text={encoded_message}"
     full_command = f'start "" "{whatsapp_url}"'
 
+    # A cold start only brings up the app, so open the chat again once the window is there
+    was_open = "whatsapp" in ActiveWindowTitle().lower()
     subprocess.run(full_command, shell=True)
-    time.sleep(5)  # Give WhatsApp time to open
-    subprocess.run(full_command, shell=True)
+    if not WaitForWindow("WhatsApp", timeout=WHATSAPP_TIMEOUT):
+        print("WhatsApp window did not appear.")
+    elif not was_open:
+        subprocess.run(full_command, shell=True)
 
+    # The call buttons in the chat header show up once the chat has loaded
     if flag == 'message':
+        voice_call_button.wait(timeout=WHATSAPP_MESSAGE_TIMEOUT)
         pyautogui.press('enter')
 
-    elif flag == 'call':
-        location = pyautogui.locateOnScreen("Frontend/Graphics/voice_call.png", confidence=0.6)
-        if location:
-            pyautogui.moveTo(pyautogui.center(location), duration=0.5)
-            pyautogui.click()
-            time.sleep(1)
-            pyautogui.click()
-        else:
-            print("Could not locate the voice call button.")
-
-    elif flag == 'video call':
-        location = pyautogui.locateOnScreen("Frontend/Graphics/video_call.png", confidence=0.6)
+    else:
+        button = voice_call_button if flag == 'call' else video_call_button
+        location = button.wait(timeout=WHATSAPP_TIMEOUT)
         if location:
-            pyautogui.moveTo(pyautogui.center(location), duration=0.5)
+            pyautogui.moveTo(pyautogui.center(location), duration=0.2)
             pyautogui.click()
             time.sleep(1)
             pyautogui.click()
         else:
-            print("Could not locate the video call button.")
+            print(f"Could not locate the {flag} button.")
 
     return jarvis_message
 
 
 def whatsapp_message(query):
-    query = query.removeprefix("send message ")
     contact_no, name = findContact(query)
     print(contact_no, name)
     if(name == 0):
@@ -204,7 +264,6 @@ def whatsapp_message(query):
         print("There aren't any contacts yet, Sir!")
 
 def whatsapp_call(query):
-    query = query.removeprefix("whatsapp call ")
     contact_no, name = findContact(query) 
     print(contact_no, name)
     if(contact_no != 0):                   
@@ -215,7 +274,6 @@ def whatsapp_call(query):
         print("There aren't any contacts yet, Sir!")
 
 def whatsapp_video(query):
-    query = query.removeprefix("video call ")
     contact_no, name = findContact(query) 
     if(contact_no != 0):                       
         message = 'video call'                 
@@ -226,11 +284,35 @@ def whatsapp_video(query):
 
 # whatsapp_video("video call scammer")
 
-def OpenApp(app, sess=requests.session()):
-    # Define known web fallbacks
-    web_apps = {
+# Define known web fallbacks
+web_apps = {
     "youtube": "www.youtube.com", "facebook": "www.facebook.com", "github": "www.github.com", "youtube studio": "studio.youtube.com", "twitter": "www.twitter.com", "instagram": "www.instagram.com", "linkedin": "www.linkedin.com", "wikipedia": "www.wikipedia.org", "reddit": "www.reddit.com", "pinterest": "www.pinterest.com", "quora": "www.quora.com", "tumblr": "www.tumblr.com", "flickr": "www.flickr.com", "snapchat": "www.snapchat.com", "tiktok": "www.tiktok.com", "vimeo": "www.vimeo.com", "dropbox": "www.dropbox.com", "onedrive": "www.onedrive.com", "google drive": "drive.google.com", "icloud": "www.icloud.com", "amazon": "www.amazon.com", "ebay": "www.ebay.com", "alibaba": "www.alibaba.com", "netflix": "www.netflix.com", "hulu": "www.hulu.com", "disney plus": "www.disneyplus.com", "hbo max": "www.hbomax.com", "spotify": "www.spotify.com", "soundcloud": "www.soundcloud.com", "apple music": "www.apple.com/apple-music", "pandora": "www.pandora.com", "deezer": "www.deezer.com", "bandcamp": "www.bandcamp.com", "bbc": "www.bbc.com", "cnn": "www.cnn.com", "nytimes": "www.nytimes.com", "the guardian": "www.theguardian.com", "forbes": "www.forbes.com", "bloomberg": "www.bloomberg.com", "reuters": "www.reuters.com", "espn": "www.espn.com", "fox news": "www.foxnews.com", "nbc news": "www.nbcnews.com", "cbs news": "www.cbsnews.com", "abc news": "www.abcnews.go.com", "msnbc": "www.msnbc.com", "npr": "www.npr.org", "wsj": "www.wsj.com", "yahoo news": "news.yahoo.com", "buzzfeed": "www.buzzfeed.com", "huffpost": "www.huffpost.com", "canva": "www.canva.com", "chatgpt": "chat.openai.com", "slack": "www.slack.com", "trello": "www.trello.com", "asana": "www.asana.com", "zoom": "www.zoom.us", "skype": "www.skype.com", "microsoft teams": "www.microsoft.com/microsoft-teams", "google meet": "meet.google.com", "webex": "www.webex.com", "jira": "www.atlassian.com/software/jira", "notion": "www.notion.so", "airtable": "www.airtable.com", "monday": "www.monday.com", "clickup": "www.clickup.com", "dropbox paper": "www.dropbox.com/paper", "confluence": "www.atlassian.com/software/confluence", "figma": "www.figma.com", "adobe xd": "www.adobe.com/products/xd.html", "invision": "www.invisionapp.com", "microsoft word": "www.microsoft.com/microsoft-365/word", "google docs": "docs.google.com", "medium": "www.medium.com", "wordpress": "www.wordpress.com", "wix": "www.wix.com", "squarespace": "www.squarespace.com", "shopify": "www.shopify.com", "bigcommerce": "www.bigcommerce.com", "weebly": "www.weebly.com", "godaddy": "www.godaddy.com", "namecheap": "www.namecheap.com", "bluehost": "www.bluehost.com", "siteground": "www.siteground.com", "hostgator": "www.hostgator.com", "dreamhost": "www.dreamhost.com", "a2 hosting": "www.a2hosting.com", "inmotion hosting": "www.inmotionhosting.com", "digitalocean": "www.digitalocean.com", "linode": "www.linode.com", "aws": "aws.amazon.com", "azure": "azure.microsoft.com", "google cloud": "cloud.google.com", "heroku": "www.heroku.com", "gitlab": "www.gitlab.com", "bitbucket": "bitbucket.org", "codepen": "codepen.io", "jsfiddle": "jsfiddle.net", "repl.it": "repl.it", "stack overflow": "stackoverflow.com", "stackoverflow careers": "stackoverflow.com/jobs", "glassdoor": "www.glassdoor.com", "indeed": "www.indeed.com", "linkedin jobs": "www.linkedin.com/jobs", "monster": "www.monster.com", "simplyhired": "www.simplyhired.com", "angel.co": "angel.co", "github jobs": "jobs.github.com", "ziprecruiter": "www.ziprecruiter.com", "careerbuilder": "www.careerbuilder.com", "snagajob": "www.snagajob.com", "dice": "www.dice.com", "jobs": "www.jobs.com", "bamboohr": "www.bamboohr.com", "workday": "www.workday.com", "adp": "www.adp.com", "sap successfactors": "www.sap.com/products/hcm.html", "oracle hcm": "www.oracle.com/applications/human-capital-management", "zenefits": "www.zenefits.com", "paycor": "www.paycor.com", "paycom": "www.paycom.com", "gusto": "www.gusto.com", "square": "squareup.com", "stripe": "www.stripe.com", "paypal": "www.paypal.com", "venmo": "www.venmo.com", "cash app": "cash.app"
-    }
+}
+
+# Installed apps, web aliases and previously resolved URLs, looked up locally before
+# asking AppOpener or scraping Google. The installed-app list refreshes in the background.
+app_index = AppIndex(resource_path("Data/AppIndex.json"), web_apps)
+app_index.start_background_refresh()
+
+def OpenApp(app, sess=scrape_session):
+    entry = app_index.resolve(app)
+    if entry:
+        try:
+            if entry["kind"] == "app":
+                appopen(entry["target"], match_closest=False, output=True, throw_error=True)
+            else:
+                print(f"[INFO] Opening indexed site for '{app}'")
+                webopen(entry["target"])
+            return True
+        except Exception as e:
+            print(f"[INFO] Indexed target for '{app}' failed: {e}")
+
+    # A site Google found for this name before opens straight away, without asking AppOpener first
+    cached = target_cache.get("google", app)
+    if cached is not None and cached is not MISS:
+        print(f"[INFO] Opening cached result for '{app}'")
+        webopen(cached)
+        return True
 
     try:
         # Try opening as a native app
@@ -249,6 +331,11 @@ def OpenApp(app, sess=requests.session()):
                 webopen(web_apps[key])
                 return True
 
+        if cached is None:
+            print(f"[INFO] No result for '{app}' last time, searching Google directly")
+            GoogleSearch(app)
+            return True
+
         # Fallback to Google search
         print(f"[INFO] No known app matched '{app}'. Searching on Google...")
 
@@ -263,7 +350,7 @@ def OpenApp(app, sess=requests.session()):
             url = f"https://www.google.com/search?q={query}"
             headers = {"User-Agent": useragent}
             try:
-                response = sess.get(url, headers=headers)
+                response = sess.get(url, headers=headers, timeout=10)
                 if response.status_code == 200:
                     return response.text
             except Exception as e:
@@ -275,9 +362,12 @@ def OpenApp(app, sess=requests.session()):
 
         if links:
             print(f"[INFO] Opening Google result: {links[0]}")
+            target_cache.put("google", app, "https://www.google.com" + links[0])
             webopen("https://www.google.com" + links[0])
         else:
             print("[WARNING] No links found in search.")
+            if html is not None:
+                target_cache.put("google", app, None)
             GoogleSearch(app)
 
         return True
@@ -319,69 +409,24 @@ def System(command):
     
     return True
 
+def Reminder(text):
+    Reply = SetReminder(text)
+    print(Reply)
+    speak(Reply)
+    return Reply
 
-async def TranslateAndExecute(commands: list[str]):
-    funcs = []
-
-    for command in commands:
-        if command.startswith("open"):
-            if "open it" in command:
-                pass
-            if "open file" == command:
-                pass
-            else:
-                fun = asyncio.to_thread(OpenApp, command.removeprefix("open "))
-                funcs.append(fun)
-        
-        elif command.startswith("general "):
-            pass
-
-        elif command.startswith("realtime "):
-            pass
-
-
-        elif command.startswith("send_message ") or command.startswith("send message "):
-            whatsapp_message(command)
-        elif command.startswith("whatsapp_call ") or command.startswith("whatsapp call "):
-            whatsapp_call(command)
-        elif command.startswith("video_call ") or command.startswith("video call "):
-            whatsapp_video(command)
-
-
-        elif command.startswith("close "):  
-            fun = asyncio.to_thread(CloseApp, command.removeprefix("close "))
-            funcs.append(fun)
-
-        elif command.startswith("play "):
-            fun = asyncio.to_thread(PlayYoutube, command.removeprefix("play "))
-            funcs.append(fun)
-
-        elif command.startswith("content "):
-            fun = asyncio.to_thread(Content, command.removeprefix("content "))
-            funcs.append(fun)
 
-        elif command.startswith("google search "):
-            fun = asyncio.to_thread(GoogleSearch, command.removeprefix("google search "))
-            funcs.append(fun)
+automation_scheduler = AutomationScheduler()
 
-        elif command.startswith("youtube search "):
-            fun = asyncio.to_thread(YoutubeSearch, command.removeprefix("youtube search "))
-            funcs.append(fun)
-
-        elif command.startswith("system "):
-            fun = asyncio.to_thread(System, command.removeprefix("system "))
-            funcs.append(fun)
-
-        else:
-            print(f"No Function found for {command}")
-
-    results = await asyncio.gather(*funcs)
-
-    for result in results: 
-        if isinstance(result, str):
-            yield result
-        else:
-            yield result
+async def TranslateAndExecute(commands: list[str]):
+    # Verbs, handlers and lanes are declared in Backend/Commands.py
+    tasks = BuildTasks(commands)
+    results = await automation_scheduler.run(tasks)
+
+    for result in results:
+        if result["status"] != OK:
+            print(f"[WARNING] '{result['command']}' {result['status']}: {result['error']}")
+        yield result
 
 async def Automation(commands: list[str]):
     async for result in TranslateAndExecute(commands):
@@ -0,0 +1,55 @@
+# Backend/Cancellation.py
+
+import threading
+from itertools import count
+
+
+class CancellationToken:
+    """In-memory cancel flag shared by everything working on one job.
+
+    Checking it is just an Event lookup, no I/O. Code that blocks on a network
+    call registers a callback (e.g. closing its response or HTTP client) so that
+    cancel() aborts the call in flight instead of waiting for it to time out.
+    """
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.lock = threading.Lock()
+        self.callbacks = {}
+        self.handles = count(1)
+
+    @property
+    def cancelled(self):
+        return self.event.is_set()
+
+    def cancel(self):
+        with self.lock:
+            if self.event.is_set():
+                return
+            self.event.set()
+            callbacks = list(self.callbacks.values())
+            self.callbacks.clear()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def register(self, callback):
+        """Run callback on cancel (right away if already cancelled); returns a handle for unregister"""
+        with self.lock:
+            if not self.event.is_set():
+                handle = next(self.handles)
+                self.callbacks[handle] = callback
+                return handle
+
+        try:
+            callback()
+        except Exception:
+            pass
+        return None
+
+    def unregister(self, handle):
+        with self.lock:
+            self.callbacks.pop(handle, None)
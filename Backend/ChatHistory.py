@@ -0,0 +1,62 @@
+# Backend/ChatHistory.py
+
+import json
+import re
+
+# ChatLog.json is written with json.dump(..., indent=4): every message starts on a line
+# that is exactly four spaces and "{", and strings never contain raw newlines.
+ENTRY_START = re.compile(rb"^    \{\r?$", re.M)
+BLOCK_SIZE = 64 * 1024
+
+
+def ReadChatPage(path, before=None, count=50):
+    """Up to count [(offset, message)] from a chat log, oldest first.
+
+    offset is the byte position of the message in the file; pass the smallest
+    one back as before to get the page preceding it (before=None gives the
+    newest page). Only the tail of the file up to before is read, block by
+    block, so the cost depends on count and not on how long the log is.
+    """
+    try:
+        with open(path, "rb") as file:
+            file.seek(0, 2)
+            end = file.tell() if before is None else min(before, file.tell())
+            pos = end
+            data = b""
+            while True:
+                read = min(BLOCK_SIZE, pos)
+                pos -= read
+                file.seek(pos)
+                data = file.read(read) + data
+                # A match at the very start of the block may be a partial line; it is found again next round
+                starts = [m.start() for m in ENTRY_START.finditer(data) if m.start() > 0 or pos == 0]
+                if len(starts) > count or pos == 0:
+                    break
+    except OSError:
+        return []
+
+    if not starts:
+        return fallback_page(path, before, count)
+
+    starts = starts[-count:]
+    page = []
+    for i, start in enumerate(starts):
+        stop = starts[i + 1] if i + 1 < len(starts) else len(data)
+        chunk = data[start:stop].rstrip().rstrip(b"]").rstrip().rstrip(b",")
+        try:
+            page.append((pos + start, json.loads(chunk)))
+        except ValueError:
+            return fallback_page(path, before, count)
+    return page
+
+
+def fallback_page(path, before, count):
+    # Not in the expected layout: read it whole once, without older pages to offer
+    if before is not None:
+        return []
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            messages = json.load(file)
+    except (OSError, ValueError):
+        return []
+    return [(0, message) for message in messages[-count:]]
@@ -1,7 +1,7 @@
 from groq import Groq #Importing the Groq library to use its API.
 from json import load, dump # Importing functions to read and write JSON files.
 import datetime # Importing the datetime module for real-time date and time information.
-from dotenv import dotenv_values # Importing dotenv_values to read environment variables from a .env file.
+from Backend.Config import config # Importing the shared configuration read from the .env file.
 
 import sys
 import os
@@ -13,23 +13,11 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
-#Load environment variables from the env file.
-env_vars = dotenv_values(resource_path(".env"))
-
-#Retrieve specific environment variables for username, assistant name, and API key.
-Username = env_vars.get("Username")
-Assistantname = env_vars.get("Assistantname")
-GroqAPIKey = env_vars.get("GroqAPIKey")
-GroqModel = env_vars.get("GroqModel")
-
-#Initialize the Groq client using the provided API key.
-client = Groq(api_key=GroqAPIKey)
-
 #Initialize an empty list to store chat messages.
 messages = []
 
 #Define a system message that provides context to the Al chatbot about its role and behavior.
-System = f"""Hello, I am {Username}, You are a very accurate and advanced AI named {Assistantname} which also has real-time up-to-date information from the internet and can provide answers to any question also you can perform various task.
+SystemPrompt = """Hello, I am {Username}, You are a very accurate and advanced AI named {Assistantname} which also has real-time up-to-date information from the internet and can provide answers to any question also you can perform various task.
 *** You will answer the question from the provided data in a professional way ***
 *** Provide Answers In a sci-fi and a Professional Way, make sure to add full stops, commas, question marks, and use proper grammar also use advance english to impress the user.***
 *** Do not tell time until I ask, just answer the question.***
@@ -38,11 +26,35 @@ System = f"""Hello, I am {Username}, You are a very accurate and advanced AI nam
 *** You have a assistance and friendly nature and also you have some feeling and some favourable choices when user asks you something based on logic. You are also cherish in nature***
 """
 
-# A list
-SystemChatBot = [
-    {"role":"system" , "content":System}
-]
+client = None
+
+#The Groq client, created on the first request rather than at import.
+def GroqClient():
+    global client
+    if client is None:
+        client = Groq(api_key=config.get("GroqAPIKey"))
+    return client
+
+#Retrieve the username, assistant name and model, and build the system message from them.
+def ApplySettings(changes=None):
+    global Username, Assistantname, GroqModel, System, SystemChatBot, client
+
+    Username = config.get("Username")
+    Assistantname = config.get("Assistantname")
+    GroqModel = config.get("GroqModel")
+
+    #A new API key needs a new client; the next request creates it.
+    if "GroqAPIKey" in (changes or {}):
+        client = None
+
+    System = SystemPrompt.format(Username=Username, Assistantname=Assistantname)
+    # A list
+    SystemChatBot = [
+        {"role":"system" , "content":System}
+    ]
 
+ApplySettings()
+config.subscribe(("Username", "Assistantname", "GroqAPIKey", "GroqModel"), ApplySettings)
 
 #Attempt to load the chat log from a JSON file.
 try:
@@ -87,7 +99,7 @@ def ChatBot(Query):
 
         messages.append({"role":"user" , "content":f"{Query}"})
             #Make a request to the Gron API for a response.
-        completion = client.chat.completions.create(
+        completion = GroqClient().chat.completions.create(
             model=GroqModel, #Specify the Al model to use.
             messages= SystemChatBot + [{"role": "system", "content": RealtimeInformation()}]+ messages, # Include system information and chat history.
             max_tokens=1024,#Limit the maximum tokens in the response.
@@ -0,0 +1,142 @@
+# Backend/Commands.py
+
+import importlib
+from Backend.Scheduler import UI, NETWORK
+
+# What a decision is for: ANSWER decisions are answered by the chatbot or search
+# engine, IMAGE ones go to the image worker and TASK ones run as automation.
+ANSWER = "answer"
+IMAGE = "image"
+TASK = "task"
+
+# Seconds each kind of task may take before its result is reported as a timeout
+UI_TIMEOUT = 30
+NETWORK_TIMEOUT = 20
+CONTENT_TIMEOUT = 120
+
+
+class CommandTrie:
+    """Character trie of command verbs.
+
+    match() walks the text once and returns the longest verb that ends on a word
+    boundary, so "youtube search cats" finds "youtube search" and "opening"
+    does not find "open". A trailing "s" still counts as the boundary, so
+    "generate images of cats" finds "generate image".
+    """
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, verb, command):
+        node = self.root
+        for ch in verb:
+            node = node.setdefault(ch, {})
+        node[None] = command
+
+    def match(self, text):
+        """(command, end of the verb in text), or (None, 0)"""
+        node = self.root
+        best = (None, 0)
+        for i, ch in enumerate(text):
+            node = node.get(ch)
+            if node is None:
+                break
+            if None not in node:
+                continue
+            if i + 1 == len(text) or text[i + 1] == " ":
+                best = (node[None], i + 1)
+            elif text[i + 1] == "s" and (i + 2 == len(text) or text[i + 2] == " "):
+                best = (node[None], i + 2)
+        return best
+
+
+command_trie = CommandTrie()
+
+
+def RegisterCommand(verb, kind=TASK, handler=None, lane=NETWORK, timeout=NETWORK_TIMEOUT, parse=None, aliases=()):
+    """Declare a decision verb.
+
+    handler is "module:function", imported the first time the command runs so
+    that registering costs nothing. parse(argument, text) turns the words after
+    the verb (and the whole decision) into handler arguments, or None to skip it;
+    by default the handler gets the argument alone.
+    """
+    command = {
+        "verb": verb, "kind": kind, "handler": handler, "lane": lane,
+        "timeout": timeout, "parse": parse, "function": None
+    }
+    for name in (verb, *aliases):
+        command_trie.insert(name, command)
+    return command
+
+
+def MatchCommand(text):
+    """(command, argument) for a decision like 'open chrome', or (None, text)"""
+    text = text.strip()
+    command, end = command_trie.match(text.lower())
+    if command is None:
+        return None, text
+    return command, text[end:].strip()
+
+
+def IsTask(text):
+    command, _ = MatchCommand(text)
+    return command is not None and command["kind"] == TASK
+
+
+def CommandFunction(command):
+    if command["function"] is None:
+        module_name, function_name = command["handler"].split(":")
+        command["function"] = getattr(importlib.import_module(module_name), function_name)
+    return command["function"]
+
+
+def BuildTasks(decisions):
+    """Scheduler tasks (command, func, args, lane, timeout) for the TASK decisions"""
+    tasks = []
+    for text in decisions:
+        command, argument = MatchCommand(text)
+        if command is None:
+            print(f"No Function found for {text}")
+            continue
+        if command["kind"] != TASK:
+            continue
+        if not argument:
+            # A bare "play" or "open" has nothing to act on
+            print(f"Nothing to {command['verb']} in '{text}'")
+            continue
+
+        args = command["parse"](argument, text) if command["parse"] else (argument,)
+        if args is None:
+            continue
+        tasks.append((text, CommandFunction(command), args, command["lane"], command["timeout"]))
+    return tasks
+
+
+def app_name(argument, text):
+    # "open it" / "open file" refer to something we can't resolve
+    return None if argument in ("it", "file") else (argument,)
+
+
+RegisterCommand("general", kind=ANSWER)
+RegisterCommand("realtime", kind=ANSWER)
+RegisterCommand("exit", kind=ANSWER)
+RegisterCommand("generate image", kind=IMAGE)
+RegisterCommand("regenerate image", kind=IMAGE)
+
+RegisterCommand("open", handler="Backend.Automation:OpenApp", parse=app_name, aliases=("opening",))
+RegisterCommand("close", handler="Backend.Automation:CloseApp", aliases=("closing",))
+RegisterCommand("play", handler="Backend.Automation:PlayYoutube")
+RegisterCommand("content", handler="Backend.Automation:Content", timeout=CONTENT_TIMEOUT)
+RegisterCommand("google search", handler="Backend.Automation:GoogleSearch")
+RegisterCommand("youtube search", handler="Backend.Automation:YoutubeSearch")
+RegisterCommand("reminder", handler="Backend.Automation:Reminder")
+# Media/volume keys go to whatever has focus
+RegisterCommand("system", handler="Backend.Automation:System", lane=UI, timeout=UI_TIMEOUT)
+# WhatsApp commands click around the WhatsApp window, so they share the UI lane
+RegisterCommand("send message", handler="Backend.Automation:whatsapp_message", lane=UI, timeout=UI_TIMEOUT,
+                aliases=("send_message",))
+RegisterCommand("whatsapp call", handler="Backend.Automation:whatsapp_call", lane=UI, timeout=UI_TIMEOUT,
+                aliases=("whatsapp_call",))
+RegisterCommand("video call", handler="Backend.Automation:whatsapp_video", lane=UI, timeout=UI_TIMEOUT,
+                aliases=("video_call",))
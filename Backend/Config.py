@@ -0,0 +1,161 @@
+# Backend/Config.py
+
+import os
+import sys
+import threading
+import time
+from dotenv import dotenv_values
+
+
+def resource_path(relative_path):
+    try:
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
+
+
+def to_bool(text):
+    return str(text).strip().lower() in ("1", "true", "yes", "on")
+
+
+# Every .env setting the assistant reads: name -> (type, default). Blank or
+# unparsable values fall back to the default.
+SETTINGS = {
+    # Who is talking to whom
+    "Username": (str, None),
+    "Assistantname": (str, None),
+    "InputLanguage": (str, "en"),
+    "AssistantVoice": (str, "en-CA-liamNeural"),
+
+    # Models and keys
+    "GroqAPIKey": (str, None),
+    "GroqModel": (str, None),
+    "CohereAPIKey": (str, None),
+    "CohereModel": (str, None),
+    "A4FAPIKey": (str, ""),
+
+    # Speech recognition
+    "TranslationCacheSize": (int, 256),
+    "EndpointSilenceMs": (int, 700),
+    "EndpointStableMs": (int, 1200),
+
+    # Automation and content
+    "ContentHistory": (int, 0),
+    "ContentEditor": (str, "notepad.exe"),
+
+    # Image generation
+    "ImageWorkers": (int, None),
+    "ImageDeadline": (float, 60.0),
+    "ImageCacheMaxMB": (float, 500.0),
+    "ImageDedup": (bool, True),
+    "DedupRetries": (int, 1),
+
+    # Chat view and animations
+    "ChatWindowSize": (int, 200),
+    "ChatPageSize": (int, 50),
+    "LowPowerAnimation": (bool, False),
+    "AnimationCacheMB": (int, 256),
+
+    # Data files
+    "RemindersDB": (str, None),
+    "ContactsDB": (str, None),
+    "ContactsFile": (str, None),
+    "DefaultCountryCode": (str, "91"),
+
+    # Startup
+    "StartupBudgetMs": (int, 800),
+}
+
+
+class Config:
+    """The .env file, parsed once and shared by every module.
+
+    get() returns values converted to the type declared in SETTINGS; keys not
+    declared there come back as strings. After watch(), the file is checked
+    every PollInterval seconds and, when it has been saved, parsed again; each
+    subscriber whose settings changed is then called with {name: new value},
+    so a voice, model or language change applies without a restart.
+    """
+
+    PollInterval = 1.0
+
+    def __init__(self, path, settings):
+        self.path = path
+        self.settings = settings
+        self.lock = threading.Lock()
+        self.values = {}
+        self.mtime = None
+        self.subscribers = []
+        self.watch_thread = None
+        self.load()
+
+    def convert(self, name, text):
+        kind, default = self.settings.get(name, (str, None))
+        if text is None or not str(text).strip():
+            return default
+        try:
+            return to_bool(text) if kind is bool else kind(str(text).strip())
+        except ValueError:
+            print(f"\033[93m[CONFIG] {name}={text!r} is not a valid {kind.__name__}, using {default!r}\033[0m")
+            return default
+
+    def load(self):
+        """Parse the file again; returns {name: new value} for the settings that changed"""
+        try:
+            mtime = os.path.getmtime(self.path)
+            raw = dotenv_values(self.path)
+        except OSError:
+            mtime, raw = None, {}
+
+        values = {name: self.convert(name, raw.get(name)) for name in set(self.settings) | set(raw)}
+        with self.lock:
+            old, self.values, self.mtime = self.values, values, mtime
+        return {name: value for name, value in values.items() if old and old.get(name) != value}
+
+    def get(self, name, default=None):
+        value = self.values.get(name)
+        return default if value is None else value
+
+    def subscribe(self, names, callback):
+        """Call callback({name: new value}) whenever any of names changes"""
+        with self.lock:
+            self.subscribers.append((set(names), callback))
+
+    def reload(self):
+        changes = self.load()
+        if changes:
+            print(f"\033[96m[CONFIG] Changed: {', '.join(sorted(changes))}\033[0m")
+
+        with self.lock:
+            subscribers = list(self.subscribers)
+        for names, callback in subscribers:
+            relevant = {name: value for name, value in changes.items() if name in names}
+            if not relevant:
+                continue
+            try:
+                callback(relevant)
+            except Exception as e:
+                print(f"[CONFIG] Applying {', '.join(relevant)} failed: {e}")
+        return changes
+
+    def watch(self):
+        """Start the thread that reloads the file when it is saved"""
+        with self.lock:
+            if self.watch_thread is not None:
+                return
+            self.watch_thread = threading.Thread(target=self.poll, name="ConfigWatcher", daemon=True)
+        self.watch_thread.start()
+
+    def poll(self):
+        while True:
+            time.sleep(self.PollInterval)
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError:
+                mtime = None
+            if mtime != self.mtime:
+                self.reload()
+
+
+config = Config(resource_path(".env"), SETTINGS)
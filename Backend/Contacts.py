@@ -0,0 +1,220 @@
+# Backend/Contacts.py
+
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from Backend.db import ensure_schema
+
+SOUNDEX_CODES = {}
+for letters, digit in (("bfpv", "1"), ("cgjkqsxz", "2"), ("dt", "3"), ("l", "4"), ("mn", "5"), ("r", "6")):
+    for letter in letters:
+        SOUNDEX_CODES[letter] = digit
+
+
+def NormalizeContactName(name):
+    return " ".join(re.sub(r"[^\w\s]", " ", str(name).lower()).split())
+
+
+def Soundex(word):
+    """Classic 4-character Soundex code, e.g. Robert/Rupert -> r163"""
+    word = "".join(ch for ch in word.lower() if ch.isalpha())
+    if not word:
+        return ""
+
+    code = word[0]
+    previous = SOUNDEX_CODES.get(word[0], "")
+    for ch in word[1:]:
+        digit = SOUNDEX_CODES.get(ch, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        # h and w don't separate letters with the same code, vowels do
+        if ch not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+
+def PhoneticKeys(name):
+    return {Soundex(word) for word in NormalizeContactName(name).split() if Soundex(word)}
+
+
+class ContactResolver:
+    """Fuzzy name -> contact lookup over the contacts table of jarvis.db.
+
+    Keeps one connection open and maintains two side indexes next to the
+    contacts table: an FTS5 trigram index of the names (substring and typo
+    matches) and a table of Soundex keys per name word (names the recognizer
+    spells differently but that sound the same). Both are brought up to date
+    incrementally whenever another connection changes the database. Candidates
+    from both are ranked by string similarity, and recent answers are kept in
+    a small LRU cache.
+    """
+
+    CacheSize = 128
+    MaxCandidates = 50
+    MinScore = 0.75
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.con = None
+        self.has_fts = False
+        self.data_version = None
+        self.cache = OrderedDict()
+
+    def connect(self):
+        if self.con is not None:
+            return self.con
+
+        con = sqlite3.connect(self.path, check_same_thread=False)
+        # Same schema as the importer, so older databases get their e164 column too
+        ensure_schema(con)
+        con.execute("CREATE TABLE IF NOT EXISTS contact_names (contact_id INTEGER PRIMARY KEY, name TEXT)")
+        con.execute("CREATE TABLE IF NOT EXISTS contact_phonetic (phonetic TEXT, contact_id INTEGER)")
+        con.execute("CREATE INDEX IF NOT EXISTS idx_contact_phonetic ON contact_phonetic (phonetic)")
+        con.execute("CREATE INDEX IF NOT EXISTS idx_contact_phonetic_id ON contact_phonetic (contact_id)")
+        try:
+            con.execute("CREATE VIRTUAL TABLE IF NOT EXISTS contact_fts USING fts5(name, tokenize='trigram')")
+            self.has_fts = True
+        except sqlite3.OperationalError as e:
+            # SQLite older than 3.34 has no trigram tokenizer; phonetic keys and similarity still work
+            print(f"[WARNING] Contact trigram index unavailable: {e}")
+        con.commit()
+        self.con = con
+        return con
+
+    def sync(self):
+        """Re-index contacts that were added, renamed or deleted since the last sync"""
+        con = self.connect()
+        version = con.execute("PRAGMA data_version").fetchone()[0]
+        if version == self.data_version:
+            return
+
+        changed = con.execute('''
+            SELECT c.id, c.name FROM contacts c
+            LEFT JOIN contact_names n ON n.contact_id = c.id
+            WHERE n.contact_id IS NULL OR n.name IS NOT c.name
+        ''').fetchall()
+        removed = con.execute('''
+            SELECT n.contact_id FROM contact_names n
+            LEFT JOIN contacts c ON c.id = n.contact_id
+            WHERE c.id IS NULL
+        ''').fetchall()
+
+        if changed or removed:
+            stale = [(contact_id,) for contact_id, _ in changed] + removed
+            with con:
+                con.executemany("DELETE FROM contact_phonetic WHERE contact_id = ?", stale)
+                con.executemany("DELETE FROM contact_names WHERE contact_id = ?", removed)
+                if self.has_fts:
+                    con.executemany("DELETE FROM contact_fts WHERE rowid = ?", stale)
+                    con.executemany(
+                        "INSERT INTO contact_fts (rowid, name) VALUES (?, ?)",
+                        ((contact_id, NormalizeContactName(name)) for contact_id, name in changed)
+                    )
+                con.executemany(
+                    "INSERT OR REPLACE INTO contact_names (contact_id, name) VALUES (?, ?)", changed
+                )
+                con.executemany(
+                    "INSERT INTO contact_phonetic (phonetic, contact_id) VALUES (?, ?)",
+                    ((key, contact_id) for contact_id, name in changed for key in PhoneticKeys(name))
+                )
+            self.cache.clear()
+
+        # data_version only moves when another connection commits
+        self.data_version = con.execute("PRAGMA data_version").fetchone()[0]
+
+    def candidates(self, query):
+        con = self.con
+        ids = set()
+
+        if self.has_fts and len(query) >= 3:
+            grams = {query[i:i + 3] for i in range(len(query) - 2)}
+            match = " OR ".join('"' + gram.replace('"', '""') + '"' for gram in grams)
+            rows = con.execute(
+                "SELECT rowid FROM contact_fts WHERE contact_fts MATCH ? ORDER BY rank LIMIT ?",
+                (match, self.MaxCandidates)
+            ).fetchall()
+            ids.update(row[0] for row in rows)
+
+        keys = list(PhoneticKeys(query))
+        if keys:
+            rows = con.execute(
+                f"SELECT DISTINCT contact_id FROM contact_phonetic WHERE phonetic IN ({','.join('?' * len(keys))}) LIMIT ?",
+                (*keys, self.MaxCandidates)
+            ).fetchall()
+            ids.update(row[0] for row in rows)
+
+        if not ids:
+            return []
+        ids = list(ids)
+        return con.execute(
+            f"SELECT id, name, COALESCE(e164, mobile_no) FROM contacts WHERE id IN ({','.join('?' * len(ids))})", ids
+        ).fetchall()
+
+    @staticmethod
+    def score(query, name):
+        """Similarity of a spoken name to a contact name, about 0..1 (higher is better)"""
+        name = NormalizeContactName(name)
+        if not name:
+            return 0.0
+        # Matching a single word of the name counts slightly less than the whole name
+        best = max(
+            SequenceMatcher(None, query, name).ratio(),
+            0.95 * max(SequenceMatcher(None, query, word).ratio() for word in name.split())
+        )
+        if name.startswith(query):
+            best = max(best, 0.9)
+        if PhoneticKeys(query) & PhoneticKeys(name):
+            best += 0.05
+        return best
+
+    def search(self, query, limit=5):
+        """Ranked [(score, name, number)] for a spoken name; number is E.164 unless it couldn't be normalized"""
+        query = NormalizeContactName(query)
+        if not query:
+            return []
+
+        with self.lock:
+            self.sync()
+            if query in self.cache:
+                self.cache.move_to_end(query)
+                return self.cache[query][:limit]
+
+            ranked = sorted(
+                ((self.score(query, name), name, mobile_no) for _, name, mobile_no in self.candidates(query)),
+                key=lambda item: item[0], reverse=True
+            )
+            ranked = [item for item in ranked if item[0] >= self.MinScore][:self.MaxCandidates]
+
+            self.cache[query] = ranked
+            if len(self.cache) > self.CacheSize:
+                self.cache.popitem(last=False)
+            return ranked[:limit]
+
+    def resolve(self, text, max_words=3):
+        """Match the contact named at the start of text.
+
+        Tries the first one to max_words words and returns (score, name, number, spoken),
+        where spoken is the part of text that named the contact, or None.
+        """
+        words = text.strip().split()
+        best = None
+        for count in range(1, min(max_words, len(words)) + 1):
+            spoken = " ".join(words[:count])
+            results = self.search(spoken, limit=1)
+            # A longer prefix has to match at least as well, so "ravi hello" doesn't
+            # swallow the start of the message but "ravi kumar" beats "ravi"
+            if results and (best is None or results[0][0] >= best[0]):
+                best = (*results[0], spoken)
+        return best
+
+    def close(self):
+        with self.lock:
+            if self.con is not None:
+                self.con.close()
+                self.con = None
+                self.data_version = None
@@ -0,0 +1,143 @@
+# Backend/ImageCache.py
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from time import time
+
+
+def NormalizePrompt(prompt):
+    """Lowercase, collapse whitespace and drop trailing punctuation so equivalent prompts share a key"""
+    return " ".join(str(prompt).lower().split()).strip(" .!?")
+
+
+class ImageCache:
+    """Content-addressed store for generated images.
+
+    Each image is saved as <key>.jpg, where the key is a SHA-256 of the normalized
+    prompt, size, model and variation, and described in manifest.json. The least
+    recently used images are evicted once the directory grows past max_bytes.
+    slots maps (prompt, size, variation) to the keys stored for it, one per model,
+    so a lookup never scans the whole manifest.
+    """
+
+    def __init__(self, directory, max_bytes, on_evict=None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.directory / "manifest.json"
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self.lock = threading.Lock()
+        self.entries = self.load()
+        self.slots = {}
+        for key, entry in self.entries.items():
+            self.index(key, entry)
+
+    def load(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as file:
+                entries = json.load(file)
+        except Exception:
+            return {}
+        # Forget entries whose file was removed behind our back
+        return {key: entry for key, entry in entries.items() if (self.directory / entry["file"]).exists()}
+
+    def save(self):
+        temp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(self.entries, file, indent=4)
+            os.replace(temp_path, self.manifest_path)
+        except Exception as e:
+            print(f"Error saving image cache manifest: {e}")
+
+    @staticmethod
+    def key(prompt, size, model, variation):
+        raw = json.dumps([NormalizePrompt(prompt), size, model, variation])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def slot(entry):
+        return (entry["prompt"], entry["size"], entry["variation"])
+
+    def index(self, key, entry):
+        self.slots.setdefault(self.slot(entry), {})[entry["model"]] = key
+
+    def remove(self, key):
+        """Forget an entry and its index slot (lock held)"""
+        entry = self.entries.pop(key)
+        models = self.slots.get(self.slot(entry), {})
+        models.pop(entry["model"], None)
+        if not models:
+            self.slots.pop(self.slot(entry), None)
+
+    def lookup(self, prompt, size, variation, model=None):
+        """Path of the most recently used cached image for these parameters, or None"""
+        with self.lock:
+            if model is not None:
+                key = self.key(prompt, size, model, variation)
+                matches = [(key, self.entries[key])] if key in self.entries else []
+            else:
+                models = self.slots.get((NormalizePrompt(prompt), size, variation), {})
+                matches = [(key, self.entries[key]) for key in models.values()]
+            if not matches:
+                return None
+
+            key, entry = max(matches, key=lambda match: match[1]["last_used"])
+            path = self.directory / entry["file"]
+            if not path.exists():
+                self.remove(key)
+                self.save()
+                return None
+
+            entry["last_used"] = time()
+            self.save()
+            return path
+
+    def store(self, prompt, size, model, variation, source_path, reason="refresh requested"):
+        """Move a freshly generated image into the cache and return its cached path;
+        reason says why an existing image for the same key is being replaced"""
+        key = self.key(prompt, size, model, variation)
+        path = self.directory / f"{key}.jpg"
+
+        with self.lock:
+            if path.exists():
+                print(f"\033[93mReplacing cached image {path.name} ({reason})\033[0m")
+                if self.on_evict:
+                    self.on_evict(path)
+            os.replace(source_path, path)
+
+            now = time()
+            entry = self.entries[key] = {
+                "prompt": NormalizePrompt(prompt),
+                "size": size,
+                "model": model,
+                "variation": variation,
+                "file": path.name,
+                "bytes": path.stat().st_size,
+                "created": now,
+                "last_used": now
+            }
+            self.index(key, entry)
+            self.evict()
+            self.save()
+
+        return path
+
+    def evict(self):
+        """Drop least recently used images until the cache fits in max_bytes (lock held)"""
+        total = sum(entry["bytes"] for entry in self.entries.values())
+        for key, entry in sorted(self.entries.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes or len(self.entries) <= 1:
+                break
+            path = self.directory / entry["file"]
+            try:
+                if self.on_evict:
+                    self.on_evict(path)
+                path.unlink(missing_ok=True)
+            except Exception as e:
+                print(f"Error evicting cached image {path.name}: {e}")
+            total -= entry["bytes"]
+            self.remove(key)
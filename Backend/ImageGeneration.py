@@ -3,13 +3,18 @@
 from random import randint
 from PIL import Image
 import requests
-from dotenv import dotenv_values
 import os
-from time import sleep
+from time import monotonic
 from typing import Literal
 from pathlib import Path
-import sys
-from groq import Groq
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from Backend.ImageModelHealth import ModelHealth
+from Backend.ImageCache import ImageCache
+from uuid import uuid4
+from Backend.Cancellation import CancellationToken
+from Backend.ImageHash import DuplicateFilter
+from Backend.Config import config
+import threading
 
 # === Constants ===
 WRITABLE_DATA_DIR = Path.home() / "JarvisData"
@@ -17,303 +22,411 @@ WRITABLE_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 ImageSize = Literal['auto', '1024x1024', '1536x1024', '1024x1536', '256x256', '512x512', '1792x1024', '1024x1792']
 
-# Global variable to control image generation
-stop_image_generation = False
-
-def resource_path(relative_path):
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+# Number of images generated per request
+IMAGE_COUNT = 4
 
 # === Env and A4F Setup ===
-env_vars = dotenv_values(resource_path(".env"))
-a4f_api_key = env_vars.get("A4FAPIKey", "")  # Get actual API key from .env
+a4f_api_key = config.get("A4FAPIKey")  # Get actual API key from .env
 a4f_base_url = "https://api.a4f.co/v1"
 
-# Get Groq API key for stop command analysis
-GROQ_API_KEY = env_vars.get("GroqAPIKey", "")
-GroqModel = env_vars.get("GroqModel", "")
+# Concurrency: bounded worker pool shared by all image jobs, and the time budget
+# (seconds) each image gets across all of its model and fallback attempts.
+ImageWorkers = config.get("ImageWorkers", IMAGE_COUNT)
+ImageDeadline = config.get("ImageDeadline")
+image_executor = ThreadPoolExecutor(max_workers=ImageWorkers, thread_name_prefix="ImageGen")
+
+A4F_MODELS = [
+    "provider-5/gpt-image-1", "provider-5/dall-e-3",
+    "provider-1/FLUX.1-schnell", "provider-2/FLUX.1-schnell",
+    "provider-3/FLUX.1-schnell", "provider-5/FLUX.1 [schnell]",
+    "provider-1/FLUX.1.1-pro"
+]
+
+# Download limits: images are streamed to disk in chunks and rejected if they are
+# too large, not an image, or decode to implausible dimensions.
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+MAX_IMAGE_BYTES = 25 * 1024 * 1024
+MAX_IMAGE_SIDE = 4096
+ALLOWED_IMAGE_FORMATS = {"JPEG", "PNG", "WEBP"}
+
+# Previews are small thumbnails decoded at reduced scale, not the full-resolution files
+THUMBNAIL_DIR = WRITABLE_DATA_DIR / "thumbnails"
+THUMBNAIL_SIZE = (512, 512)
+
+def remove_thumbnail(image_path):
+    """Drop the preview of an image that is being evicted or replaced"""
+    (THUMBNAIL_DIR / Path(image_path).name).unlink(missing_ok=True)
+
+# Generated images are stored once per (prompt, size, model, variation) and reused
+# for repeat prompts; the least recently used ones go once the cache passes its size limit.
+ImageCacheMaxBytes = int(config.get("ImageCacheMaxMB") * 1024 * 1024)
+image_cache = ImageCache(WRITABLE_DATA_DIR / "image_cache", ImageCacheMaxBytes, on_evict=remove_thumbnail)
 
-# Initialize Groq client
-if GROQ_API_KEY:
-    groq_client = Groq(api_key=GROQ_API_KEY)
-else:
-    print("\033[93mWarning: GROQ_API_KEY not found in .env file. Stop detection will be basic.\033[0m")
-    groq_client = None
+# Leftovers from downloads interrupted by a crash or shutdown
+for leftover in image_cache.directory.glob("staging_*"):
+    leftover.unlink(missing_ok=True)
+
+# Near-identical results (common with pollinations and "variation i" prompts) are
+# rejected by perceptual hash and regenerated up to DedupRetries times with a new seed.
+ImageDedup = config.get("ImageDedup")
+DedupRetries = config.get("DedupRetries")
+
+# Success rate, latency and circuit-breaker state of each A4F model, kept across runs
+model_health = ModelHealth(WRITABLE_DATA_DIR / "a4f_model_health.json")
 
 try:
     from openai import OpenAI
+    import httpx
     A4F_AVAILABLE = True
-    a4f_client = OpenAI(api_key=a4f_api_key, base_url=a4f_base_url) if a4f_api_key else None
+    # One pooled HTTP client for every A4F call, so parallel slots and retries reuse connections
+    a4f_http_client = httpx.Client(limits=httpx.Limits(max_connections=IMAGE_COUNT * 2))
 except ImportError:
     A4F_AVAILABLE = False
-    a4f_client = None
+    a4f_http_client = None
     print("Install A4F using: pip install a4f-local openai")
 
-def check_stop_command():
-    """Quick check for stop commands without continuous monitoring"""
-    global stop_image_generation
-    
-    try:
-        input_file_path = resource_path("Data/input.txt")
-        if os.path.exists(input_file_path):
-            with open(input_file_path, 'r', encoding='utf-8') as file:
-                content = file.read().strip()
-                
-                if content:
-                    # Check for explicit stop command marker
-                    if content == "STOP_COMMAND_FOR_ASSISTANT":
-                        print("\033[91mStop command detected! Stopping image generation...\033[0m")
-                        stop_image_generation = True
-                        return True
-                    
-                    # Check for natural stop commands
-                    elif 'stop' in content.lower():
-                        if analyze_stop_command(content):
-                            print(f"\033[91mStop command detected: '{content}'\033[0m")
-                            stop_image_generation = True
-                            return True
-        
-        return stop_image_generation
-        
-    except Exception:
-        return stop_image_generation
+def CreateA4FClient():
+    if not (A4F_AVAILABLE and a4f_api_key):
+        return None
+    # No SDK retries: they would run past the per-image deadline, and the model loop retries anyway.
+    # Each call passes its own timeout from what is left of that deadline.
+    return OpenAI(api_key=a4f_api_key, base_url=a4f_base_url, http_client=a4f_http_client, max_retries=0)
 
-def analyze_stop_command(text):
-    """Use Groq API to analyze if the stop command is meant for the assistant"""
-    global groq_client
-    
-    if not groq_client:
-        # Fallback to basic detection if no API key
-        return 'stop' in text.lower() and ('jarvis' in text.lower() or 'assistant' in text.lower())
-    
+a4f_client = CreateA4FClient()
+
+def ApplySettings(changes):
+    """Pick up a new A4F key, deadline or dedup setting; the pool and cache keep their size until restart"""
+    global a4f_api_key, a4f_client, ImageDeadline, ImageDedup, DedupRetries
+
+    ImageDeadline = config.get("ImageDeadline")
+    ImageDedup = config.get("ImageDedup")
+    DedupRetries = config.get("DedupRetries")
+    if "A4FAPIKey" in changes:
+        a4f_api_key = config.get("A4FAPIKey")
+        a4f_client = CreateA4FClient()
+
+config.subscribe(("A4FAPIKey", "ImageDeadline", "ImageDedup", "DedupRetries"), ApplySettings)
+
+def download_image(url, path, timeout, token=None):
+    """Stream an image straight to disk and validate it; True if a usable image landed at path"""
+    token = token or CancellationToken()
+    path = Path(path)
+    temp_path = path.with_name(path.name + ".part")
+    handle = None
+    # One session per download, so closing it afterwards also drops a request abandoned by a stop
+    session = requests.Session()
     try:
-        prompt = f"""
-        You are an AI assistant analyzer. Your job is to determine if a user's sentence contains a command to stop an AI assistant (like Jarvis) from speaking or performing a task.
+        # The token is the only stop check here: no file reads or API calls per chunk
+        if token.cancelled:
+            return False
+        # Pollinations renders the image before it sends headers; wait for them on a helper thread
+        res = run_cancellable(token, session.get, url, timeout=timeout, stream=True)
+        if res is None:
+            return False
+        with res:
+            # Cancelling closes the connection, which aborts the read below
+            handle = token.register(res.close)
+            if res.status_code != 200:
+                return False
 
-        Analyze this sentence: "{text}"
+            content_type = res.headers.get("Content-Type", "image/")
+            if not content_type.startswith("image/"):
+                print(f"Rejected download with content type {content_type}")
+                return False
 
-        Consider these scenarios:
-        - "stop" or "jarvis stop" or "stop talking" = TRUE (command to stop assistant)
-        - "stop the music" or "stop playing" = TRUE (command to stop assistant actions)
-        - "I need to stop at the store" = FALSE (not a command to assistant)
-        - "The stop sign was red" = FALSE (not a command to assistant)
-        - "Stop what you're doing" = TRUE (command to stop assistant)
-        - "Can you stop please" = TRUE (command to stop assistant)
+            if int(res.headers.get("Content-Length") or 0) > MAX_IMAGE_BYTES:
+                print("Rejected download larger than the image size limit")
+                return False
 
-        Respond with only "TRUE" if this is a command to stop the assistant, or "FALSE" if it's just normal conversation containing the word "stop" but not meant as a command.
-        """
-        
-        response = groq_client.chat.completions.create(
-            messages=[{"role": "user", "content": prompt}],
-            model=GroqModel,
-            temperature=0.1,
-            max_tokens=10
-        )
-        
-        result = response.choices[0].message.content.strip().upper()
-        return result == "TRUE"
-            
+            written = 0
+            with open(temp_path, "wb") as f:
+                for chunk in res.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if token.cancelled:
+                        return False
+                    written += len(chunk)
+                    if written > MAX_IMAGE_BYTES:
+                        print("Rejected download larger than the image size limit")
+                        return False
+                    f.write(chunk)
+
+        # Header-only check: verify() doesn't decode the pixel data
+        with Image.open(temp_path) as img:
+            if img.format not in ALLOWED_IMAGE_FORMATS or max(img.size) > MAX_IMAGE_SIDE:
+                print(f"Rejected image {img.format} {img.size}")
+                return False
+            img.verify()
+
+        os.replace(temp_path, path)
+        return True
     except Exception as e:
-        print(f"\033[91mError with Groq API: {e}\033[0m")
-        # Fallback to basic detection
-        return 'stop' in text.lower() and ('jarvis' in text.lower() or 'assistant' in text.lower())
-
-def open_images(prompt):
-    """Open generated images with stop check"""
-    if check_stop_command():
-        print("\033[93mSkipping image opening due to stop command\033[0m")
-        return
-        
-    prompt = prompt.replace(" ", "_")
-    for i in range(1, 5):
-        if check_stop_command():
-            print("\033[93mImage opening stopped by user command\033[0m")
-            break
-            
-        image_path = WRITABLE_DATA_DIR / f'generated_{prompt}{i}.jpg'
-        if image_path.exists():
+        if not token.cancelled:
+            print(f"Error downloading image: {e}")
+        return False
+    finally:
+        token.unregister(handle)
+        session.close()
+        if temp_path.exists():
             try:
-                Image.open(image_path).show()
-                sleep(1)
-            except Exception as e:
-                print(f"Error opening image {i}: {e}")
-
-def generate_image_with_a4f_single(prompt, image_number, size: ImageSize):
-    """Generate single image with A4F - with stop checks"""
-    if not a4f_client or check_stop_command(): 
+                temp_path.unlink()
+            except Exception:
+                pass
+
+def make_thumbnail(image_path):
+    """Build a preview thumbnail using draft/reduce decoding, returns its path"""
+    image_path = Path(image_path)
+    THUMBNAIL_DIR.mkdir(parents=True, exist_ok=True)
+    thumbnail_path = THUMBNAIL_DIR / image_path.name
+
+    if thumbnail_path.exists() and thumbnail_path.stat().st_mtime >= image_path.stat().st_mtime:
+        return thumbnail_path
+
+    with Image.open(image_path) as img:
+        # JPEG: let the decoder scale down by 1/2, 1/4 or 1/8 instead of decoding full size
+        img.draft("RGB", THUMBNAIL_SIZE)
+        img = img.convert("RGB")
+        # reducing_gap makes thumbnail() use the cheap integer reduce() before resampling
+        img.thumbnail(THUMBNAIL_SIZE, reducing_gap=2.0)
+        img.save(thumbnail_path, "JPEG", quality=85)
+
+    return thumbnail_path
+
+def remaining_time(deadline, cap):
+    """Seconds left before the deadline, capped for a single HTTP call"""
+    if deadline is None:
+        return cap
+    return max(0.0, min(cap, deadline - monotonic()))
+
+def run_cancellable(token, func, *args, **kwargs):
+    """func(*args, **kwargs) on a helper thread; its result, or None as soon as token is cancelled.
+
+    The token is registered before the call starts, so a stop while connecting or
+    waiting for the first byte returns at once. Nothing aborts the call itself: it
+    is left running on its daemon thread until it finishes or its own timeout ends it.
+    """
+    finished = threading.Event()
+    outcome = {}
+
+    def call():
+        try:
+            outcome["value"] = func(*args, **kwargs)
+        except Exception as e:
+            outcome["error"] = e
+        finally:
+            finished.set()
+
+    handle = token.register(finished.set)
+    try:
+        if token.cancelled:
+            return None
+        threading.Thread(target=call, name="ImageRequest", daemon=True).start()
+        finished.wait()
+    finally:
+        token.unregister(handle)
+
+    if token.cancelled:
+        return None
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+def generate_image_with_a4f_single(prompt, image_number, size: ImageSize, path, deadline=None, token=None, seed=None):
+    """Generate single image with A4F into path - healthiest models first, with stop checks.
+    seed, if given, goes with the request rather than into the prompt.
+    Returns the model that produced the image, or False."""
+    token = token or CancellationToken()
+    if not a4f_client or token.cancelled: 
         return False
-        
-    models = [
-        "provider-5/gpt-image-1", "provider-5/dall-e-3",
-        "provider-1/FLUX.1-schnell", "provider-2/FLUX.1-schnell",
-        "provider-3/FLUX.1-schnell", "provider-5/FLUX.1 [schnell]",
-        "provider-1/FLUX.1.1-pro"
-    ]
     
-    for model in models:
-        if check_stop_command():
+    for model in model_health.order(A4F_MODELS, size):
+        if token.cancelled:
             print(f"\033[91mImage generation {image_number} stopped by user command\033[0m")
             return False
-            
+
+        if remaining_time(deadline, 60) <= 0:
+            print(f"\033[93mImage {image_number} ran out of time on A4F\033[0m")
+            return False
+
+        # Another slot may have opened the breaker or claimed the half-open probe meanwhile
+        if not model_health.acquire(model):
+            continue
+
+        started = monotonic()
+        recorded = False
         try:
-            response = a4f_client.images.generate(
+            response = run_cancellable(
+                token,
+                a4f_client.images.generate,
                 model=model,
                 prompt=prompt,
                 n=1,
                 size=size,
-                response_format="url"
+                response_format="url",
+                timeout=remaining_time(deadline, 60),
+                extra_body={"seed": seed} if seed is not None else None
             )
             
-            if check_stop_command():
+            if token.cancelled:
                 print(f"\033[91mImage generation {image_number} stopped during API call\033[0m")
                 return False
                 
             image_url = response.data[0].url if response and response.data else None
             if image_url:
-                res = requests.get(image_url, timeout=15)
+                downloaded = download_image(image_url, path, remaining_time(deadline, 15), token)
                 
-                if check_stop_command():
+                if token.cancelled:
                     print(f"\033[91mImage generation {image_number} stopped during download\033[0m")
                     return False
                     
-                if res.status_code == 200:
-                    filename = f"generated_{prompt.replace(' ', '_')}{image_number}.jpg"
-                    with open(WRITABLE_DATA_DIR / filename, "wb") as f:
-                        f.write(res.content)
-                    return True
+                if downloaded:
+                    model_health.record_success(model, size, monotonic() - started)
+                    recorded = True
+                    return model
+
+            if remaining_time(deadline, 60) > 0:
+                model_health.record_failure(model)
+                recorded = True
         except Exception: 
-            if check_stop_command():
+            if token.cancelled:
                 return False
+            # A timeout cut short by our own deadline says nothing about the model
+            if remaining_time(deadline, 60) > 0:
+                model_health.record_failure(model)
+                recorded = True
             continue
+        finally:
+            # Stopped mid-call or out of budget: no verdict on the model, just free its probe slot
+            if not recorded:
+                model_health.release(model)
     return False
 
-def generate_fallback_images(prompt, start_index=1, size: ImageSize = "1024x1024"):
-    """Generate fallback images with stop checks"""
-    if check_stop_command():
-        print("\033[93mSkipping fallback image generation due to stop command\033[0m")
-        return
-        
+def generate_fallback_image_single(prompt, image_number, path, size: ImageSize = "1024x1024", deadline=None, token=None):
+    """Generate one fallback image from pollinations into path with stop checks"""
+    token = token or CancellationToken()
+    if token.cancelled:
+        print(f"\033[91mFallback image generation stopped at image {image_number}\033[0m")
+        return False
+
+    timeout = remaining_time(deadline, 30)
+    if timeout <= 0:
+        print(f"\033[93mFallback image {image_number} ran out of time\033[0m")
+        return False
+
     width, height = map(int, size.split('x')) if size != "auto" else (1024, 1024)
-    
-    for i in range(start_index, 5):
-        if check_stop_command():
-            print(f"\033[91mFallback image generation stopped at image {i}\033[0m")
-            break
-            
-        try:
-            url = f"https://image.pollinations.ai/prompt/{prompt.replace(' ', '%20')}?width={width}&height={height}&seed={randint(0, 100000)}"
-            res = requests.get(url, timeout=30)
+
+    try:
+        url = f"https://image.pollinations.ai/prompt/{prompt.replace(' ', '%20')}?width={width}&height={height}&seed={randint(0, 100000)}"
+        downloaded = download_image(url, path, timeout, token)
+        
+        if token.cancelled:
+            print(f"\033[91mFallback image {image_number} stopped during download\033[0m")
+            return False
             
-            if check_stop_command():
-                print(f"\033[91mFallback image {i} stopped during download\033[0m")
-                break
-                
-            if res.status_code == 200:
-                filename = f"generated_{prompt.replace(' ', '_')}{i}.jpg"
-                with open(WRITABLE_DATA_DIR / filename, "wb") as f:
-                    f.write(res.content)
-                print(f"Fallback image {i} generated")
-            sleep(1)
-        except Exception as e:
-            if check_stop_command():
-                print(f"\033[91mFallback image {i} stopped due to error: {e}\033[0m")
-                break
-            print(f"Error in fallback gen {i}: {e}")
-
-def GenerateImages(prompt: str, size: ImageSize = "1024x1024"):
-    """Main function to generate images - simplified with stop checks"""
-    global stop_image_generation
+        if downloaded:
+            print(f"Fallback image {image_number} generated")
+            return True
+    except Exception as e:
+        if token.cancelled:
+            print(f"\033[91mFallback image {image_number} stopped due to error: {e}\033[0m")
+            return False
+        print(f"Error in fallback gen {image_number}: {e}")
+    return False
+
+def generate_image_slot(prompt, image_number, size: ImageSize, deadline, refresh, token, duplicates=None):
+    """Fill one image slot from the cache, else A4F, else pollinations; returns the image path or None.
+    With a DuplicateFilter, near-duplicates of the job's other images are rejected and regenerated."""
+    if not refresh:
+        cached = image_cache.lookup(prompt, size, image_number)
+        if cached and (duplicates is None or duplicates.accept(cached)):
+            print(f"Image {image_number} served from cache")
+            return cached
+        if cached:
+            print(f"Cached image {image_number} duplicates another slot, generating a new one")
+
+    attempts = 1 + (DedupRetries if duplicates is not None else 0)
+    for attempt in range(attempts):
+        # Download to a private staging file; the cache moves it to its content-addressed name
+        staging_path = image_cache.directory / f"staging_{uuid4().hex}.jpg"
+        model = False
+
+        if a4f_client and a4f_api_key:
+            a4f_prompt = prompt if image_number == 1 else f"{prompt}, variation {image_number}"
+            # A regeneration keeps the prompt and asks for a different seed
+            seed = randint(0, 100000) if attempt else None
+            # Leave part of the budget for the fallback download if every model fails.
+            a4f_deadline = deadline - min(30, ImageDeadline / 2)
+            model = generate_image_with_a4f_single(a4f_prompt, image_number, size, staging_path, a4f_deadline, token, seed)
+
+        if not model and not token.cancelled:
+            print(f"Falling back for image {image_number}")
+            # Pollinations picks a fresh random seed on every call
+            if generate_fallback_image_single(prompt, image_number, staging_path, size, deadline, token):
+                model = "pollinations"
+
+        if not model or token.cancelled:
+            staging_path.unlink(missing_ok=True)
+            return None
+
+        if duplicates is None or duplicates.accept(staging_path):
+            reason = "refresh requested" if refresh else "regenerated near-duplicate"
+            return image_cache.store(prompt, size, model, image_number, staging_path, reason)
+
+        staging_path.unlink(missing_ok=True)
+        if attempt + 1 < attempts:
+            print(f"\033[93mImage {image_number} is a near-duplicate, regenerating with a new seed\033[0m")
+        else:
+            print(f"\033[93mImage {image_number} is a near-duplicate, dropping it\033[0m")
+
+    return None
+
+def GenerateImages(prompt: str, size: ImageSize = "1024x1024", refresh: bool = False, on_progress=None, token=None):
+    """Main function to generate images - all slots are requested in parallel.
+    Cached images are reused unless refresh is True. on_progress(image_number, path, thumbnail)
+    is called as soon as each slot finishes, with None paths for a failed slot, so
+    previews can be shown progressively. Cancelling token stops the job and aborts
+    its in-flight requests."""
+    token = token or CancellationToken()
     
     print(f"\033[94mStarting image generation for: '{prompt}'\033[0m")
     
     # Check if stopped before starting
-    if check_stop_command():
+    if token.cancelled:
         print("\033[93mImage generation cancelled before starting\033[0m")
-        return
-    
-    success = 0
-    
-    # Try A4F first if available
+        return []
+
     if a4f_client and a4f_api_key:
         print("Using A4F...")
-        if generate_image_with_a4f_single(prompt, 1, size):
-            success = 1
-            # Generate variations
-            for i in range(2, 5):
-                if check_stop_command():
-                    print(f"\033[91mImage generation stopped at variation {i}\033[0m")
-                    break
-                if generate_image_with_a4f_single(f"{prompt}, variation {i}", i, size):
-                    success += 1
-    
-    # Use fallback if needed and not stopped
-    if success < 4 and not check_stop_command():
-        print(f"Falling back for {4 - success} images")
-        generate_fallback_images(prompt, start_index=success+1, size=size)
+
+    # Every slot shares the same deadline, so the job takes about as long as the slowest image.
+    deadline = monotonic() + ImageDeadline
+    duplicates = DuplicateFilter() if ImageDedup else None
+    futures = [
+        image_executor.submit(generate_image_slot, prompt, i, size, deadline, refresh, token, duplicates)
+        for i in range(1, IMAGE_COUNT + 1)
+    ]
+
+    image_paths = [None] * IMAGE_COUNT
+    for future in as_completed(futures):
+        image_number = futures.index(future) + 1
+        thumbnail = None
+        try:
+            image_paths[image_number - 1] = future.result()
+            if image_paths[image_number - 1] and not token.cancelled:
+                thumbnail = make_thumbnail(image_paths[image_number - 1])
+        except Exception as e:
+            print(f"[ImageGen Error] {e}")
+        if on_progress and not token.cancelled:
+            on_progress(image_number, image_paths[image_number - 1], thumbnail)
+
+    success = sum(1 for path in image_paths if path)
+    print(f"{success} of {IMAGE_COUNT} images generated")
     
-    # Open images if any were generated and not stopped
-    if not check_stop_command():
-        open_images(prompt)
+    if not token.cancelled:
         print(f"\033[92mImage generation completed!\033[0m")
     else:
         print("\033[93mImage generation interrupted by user command\033[0m")
 
-def ProcessImageRequestFromDataFile():
-    """Process image generation request from data file"""
-    try:
-        file_path = resource_path("Frontend/Files/ImageGeneration.data")
-        
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        # Check if file exists, if not create it
-        if not os.path.exists(file_path):
-            with open(file_path, "w") as f:
-                f.write("False,False")
-            return
-            
-        with open(file_path, "r") as f:
-            data = f.read().strip()
-            
-        if not data or "," not in data:
-            print("Invalid ImageGeneration.data format.")
-            return
-            
-        parts = data.split(",")
-        prompt = parts[0].strip()
-        status = parts[1].strip()
-        size = parts[2].strip() if len(parts) > 2 else "1024x1024"
-        
-        if status != "True":
-            return
-            
-        print(f"\033[94mProcessing image request: {prompt}, size: {size}\033[0m")
-        
-        # Generate images
-        GenerateImages(prompt, size)
-        
-        # Reset to prevent regeneration
-        with open(file_path, "w") as f:
-            f.write("False,False")
-        
-    except Exception as e:
-        print(f"[ImageGen Error] {e}")
-
-def reset_image_generation():
-    """Reset the image generation system"""
-    global stop_image_generation
-    stop_image_generation = False
-    print("\033[96mImage generation system reset\033[0m")
-
-def stop_image_generation_immediately():
-    """Immediately stop image generation"""
-    global stop_image_generation
-    stop_image_generation = True
-    print("\033[91mImage generation stopped immediately!\033[0m")
+    return image_paths
 
-# Keep the automatic execution like the old code
 if __name__ == "__main__":
-    ProcessImageRequestFromDataFile()
\ No newline at end of file
+    for image_path in GenerateImages(input("Image prompt: ")):
+        print(image_path)
\ No newline at end of file
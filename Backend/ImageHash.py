@@ -0,0 +1,76 @@
+# Backend/ImageHash.py
+
+import threading
+import numpy as np
+from PIL import Image
+
+HASH_SIZE = 8
+PHASH_SAMPLE = 32
+
+
+def dct_matrix(n):
+    """Orthonormal DCT-II basis, so a 2-D DCT is just two matrix products"""
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    matrix = np.sqrt(2.0 / n) * np.cos(np.pi * (2 * i + 1) * k / (2 * n))
+    matrix[0] /= np.sqrt(2.0)
+    return matrix
+
+DCT = dct_matrix(PHASH_SAMPLE)
+
+
+def grayscale(path, width, height):
+    """Small grayscale float array of an image, decoded at reduced scale when possible"""
+    with Image.open(path) as img:
+        img.draft("L", (width * 4, height * 4))
+        small = img.convert("L").resize((width, height), Image.LANCZOS)
+        return np.asarray(small, dtype=np.float32)
+
+
+def ImageHashes(path):
+    """Return (phash, dhash) of an image as 64-element boolean arrays"""
+    pixels = grayscale(path, PHASH_SAMPLE, PHASH_SAMPLE)
+    low = (DCT @ pixels @ DCT.T)[:HASH_SIZE, :HASH_SIZE].ravel()
+    # Skip the DC term when taking the median, it only encodes overall brightness
+    phash = low > np.median(low[1:])
+
+    pixels = grayscale(path, HASH_SIZE + 1, HASH_SIZE)
+    dhash = (pixels[:, 1:] > pixels[:, :-1]).ravel()
+
+    return phash, dhash
+
+
+class DuplicateFilter:
+    """Remembers the hashes of one job's images and rejects near-duplicates.
+
+    An image is a duplicate when both its pHash and dHash are within the Hamming
+    thresholds of an image already accepted. Distances to every kept image are
+    computed in one vectorized comparison.
+    """
+
+    def __init__(self, phash_threshold=10, dhash_threshold=12):
+        self.phash_threshold = phash_threshold
+        self.dhash_threshold = dhash_threshold
+        self.lock = threading.Lock()
+        self.phashes = np.empty((0, HASH_SIZE * HASH_SIZE), dtype=bool)
+        self.dhashes = np.empty((0, HASH_SIZE * HASH_SIZE), dtype=bool)
+
+    def accept(self, path):
+        """Hash the image at path; keep and return True if it is distinct, else False"""
+        try:
+            phash, dhash = ImageHashes(path)
+        except Exception as e:
+            print(f"Error hashing image: {e}")
+            return True
+
+        with self.lock:
+            if len(self.phashes):
+                phash_distances = np.count_nonzero(self.phashes != phash, axis=1)
+                dhash_distances = np.count_nonzero(self.dhashes != dhash, axis=1)
+                duplicates = (phash_distances <= self.phash_threshold) & (dhash_distances <= self.dhash_threshold)
+                if duplicates.any():
+                    return False
+
+            self.phashes = np.vstack([self.phashes, phash])
+            self.dhashes = np.vstack([self.dhashes, dhash])
+            return True
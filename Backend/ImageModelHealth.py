@@ -0,0 +1,132 @@
+# Backend/ImageModelHealth.py
+
+import json
+import os
+import threading
+from statistics import median
+from time import time
+
+
+class ModelHealth:
+    """Per-model success/latency scoreboard with a circuit breaker, persisted to JSON.
+
+    A model whose calls fail FailureThreshold times in a row is "open" and skipped
+    for Cooldown seconds. After that it is "half-open": a single probe call is let
+    through, and its outcome closes the breaker again or re-opens it.
+    """
+
+    FailureThreshold = 3
+    Cooldown = 120
+    LatencyWindow = 20
+    DefaultLatency = 30.0
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.probing = set()
+        self.models = self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except Exception:
+            return {}
+
+    def save(self):
+        """Write the scoreboard atomically so a crash never leaves a torn file"""
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(self.models, file, indent=4)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"Error saving model health: {e}")
+
+    def entry(self, model):
+        return self.models.setdefault(model, {
+            "successes": 0,
+            "failures": 0,
+            "consecutive_failures": 0,
+            "opened_at": None,
+            "latencies": {}
+        })
+
+    def state(self, model):
+        """Return "closed", "open" or "half-open" for a model"""
+        opened_at = self.models.get(model, {}).get("opened_at")
+        if opened_at is None:
+            return "closed"
+        if time() - opened_at >= self.Cooldown:
+            return "half-open"
+        return "open"
+
+    def success_rate(self, model):
+        data = self.models.get(model, {})
+        # Laplace smoothing so unseen models start at 0.5 instead of 0 or 1
+        return (data.get("successes", 0) + 1) / (data.get("successes", 0) + data.get("failures", 0) + 2)
+
+    def p50_latency(self, model, size):
+        latencies = self.models.get(model, {}).get("latencies", {})
+        samples = latencies.get(size) or [value for values in latencies.values() for value in values]
+        return median(samples) if samples else self.DefaultLatency
+
+    def order(self, models, size):
+        """Healthy models first, best success rate then lowest p50 latency for the size.
+
+        Open models are left out. A half-open model is included only if nobody
+        else is currently probing it.
+        """
+        with self.lock:
+            available = []
+            for model in models:
+                state = self.state(model)
+                if state == "open" or (state == "half-open" and model in self.probing):
+                    continue
+                available.append(model)
+
+            return sorted(
+                available,
+                key=lambda model: (-round(self.success_rate(model), 2), self.p50_latency(model, size))
+            )
+
+    def acquire(self, model):
+        """Claim the call slot for a model; False if its breaker forbids a call right now"""
+        with self.lock:
+            state = self.state(model)
+            if state == "open":
+                return False
+            if state == "half-open":
+                if model in self.probing:
+                    return False
+                self.probing.add(model)
+            return True
+
+    def record_success(self, model, size, latency):
+        with self.lock:
+            data = self.entry(model)
+            data["successes"] += 1
+            data["consecutive_failures"] = 0
+            data["opened_at"] = None
+            samples = data["latencies"].setdefault(size, [])
+            samples.append(round(latency, 3))
+            del samples[:-self.LatencyWindow]
+            self.probing.discard(model)
+            self.save()
+
+    def record_failure(self, model):
+        with self.lock:
+            data = self.entry(model)
+            data["failures"] += 1
+            data["consecutive_failures"] += 1
+            if model in self.probing or data["consecutive_failures"] >= self.FailureThreshold:
+                if data["opened_at"] is None or model in self.probing:
+                    print(f"\033[93mCircuit opened for image model {model}\033[0m")
+                data["opened_at"] = time()
+            self.probing.discard(model)
+            self.save()
+
+    def release(self, model):
+        """Give back a half-open probe slot that ended without a verdict (e.g. a stop command)"""
+        with self.lock:
+            self.probing.discard(model)
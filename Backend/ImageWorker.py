@@ -1,54 +1,255 @@
 # Backend/ImageWorker.py
-from ImageGeneration import GenerateImages
-from dotenv import dotenv_values
+import multiprocessing
+import threading
+import queue
 import sys
 import os
+from itertools import count
 
 # Add root dir to Python path (so `Backend` can be found)
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+# Job states reported back by the worker process
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
 
-def resource_path(relative_path):
-    try:
-        base_path = sys._MEIPASS  # PyInstaller runtime
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+# Parent-side view of the worker: the process, its queues and every job submitted to it.
+worker_process = None
+command_queue = None
+event_queue = None
+event_listener_thread = None
+jobs = {}
+job_callbacks = {}
+image_callbacks = {}
+jobs_lock = threading.Lock()
+job_ids = count(1)
 
-def main():
-    data_file = resource_path("Frontend/Files/ImageGeneration.data")
 
-    try:
-        with open(data_file, "r", encoding="utf-8") as f:
-            data = f.read().strip()
-    except Exception as e:
-        sys.exit(f"Failed to read ImageGeneration.data: {e}")
+def worker_main(commands, events):
+    """Entry point of the image worker process: runs queued jobs one at a time."""
+    from Backend.ImageGeneration import GenerateImages
+    from Backend.Cancellation import CancellationToken
+    from Backend.Config import config
 
-    if "," not in data:
-        sys.exit("Invalid ImageGeneration.data format")
+    # This process has its own copy of the settings; keep it following the .env file too
+    config.watch()
 
-    parts = data.split(",")
-    if len(parts) < 2:
-        sys.exit("Invalid data structure. Expected: prompt,status[,size]")
+    pending = queue.Queue()
+    cancelled = set()
+    current = {"job_id": None, "token": None}
+    current_lock = threading.Lock()
 
-    prompt = parts[0].strip()
-    status = parts[1].strip().lower()
-    size = parts[2].strip() if len(parts) >= 3 else "1024x1024"
+    def read_commands():
+        """Receive submit/cancel commands while a job is running."""
+        while True:
+            command = commands.get()
+            action = command[0]
 
-    # Prevent accidental re-trigger with "False" or empty prompt
-    if status != "true" or prompt.lower() == "false" or not prompt.strip():
-        print("Nothing to generate. Exiting...")
+            if action == "submit":
+                pending.put(command[1])
+
+            elif action == "cancel":
+                with current_lock:
+                    cancelled.add(command[1])
+                    if command[1] == current["job_id"]:
+                        current["token"].cancel()
+
+            elif action == "cancel_all":
+                while True:
+                    try:
+                        job = pending.get_nowait()
+                        cancelled.add(job["job_id"])
+                    except queue.Empty:
+                        break
+                with current_lock:
+                    if current["job_id"] is not None:
+                        cancelled.add(current["job_id"])
+                        current["token"].cancel()
+
+            elif action == "shutdown":
+                pending.put(None)
+                return
+
+    threading.Thread(target=read_commands, daemon=True).start()
+
+    while True:
+        job = pending.get()
+        if job is None:
+            break
+
+        job_id = job["job_id"]
+        with current_lock:
+            if job_id in cancelled:
+                events.put((job_id, CANCELLED, 0, [], [], None))
+                continue
+            current["job_id"] = job_id
+            current["token"] = token = CancellationToken()
+
+        events.put((job_id, RUNNING, 0, [], [], None))
+
+        finished = []
+        thumbnails = []
+
+        def on_progress(image_number, path, thumbnail):
+            finished.append(str(path) if path else None)
+            if thumbnail:
+                thumbnails.append(str(thumbnail))
+            events.put((job_id, RUNNING, len(finished), [p for p in finished if p], list(thumbnails), None))
+
+        try:
+            image_paths = GenerateImages(job["prompt"], job["size"], job["refresh"], on_progress=on_progress, token=token)
+            results = [str(path) for path in image_paths if path]
+            with current_lock:
+                status = CANCELLED if job_id in cancelled else DONE
+            events.put((job_id, status, len(image_paths), results, list(thumbnails), None))
+        except Exception as e:
+            print(f"[ImageWorker Error] {e}")
+            events.put((job_id, FAILED, 0, [], list(thumbnails), str(e)))
+        finally:
+            with current_lock:
+                current["job_id"] = None
+                current["token"] = None
+                cancelled.discard(job_id)
+
+
+def listen_for_events():
+    """Parent-side thread that applies worker events to the jobs table."""
+    while True:
+        try:
+            event = event_queue.get()
+        except (EOFError, OSError):
+            break
+        if event is None:
+            break
+
+        job_id, status, progress, results, thumbnails, error = event
+        with jobs_lock:
+            job = jobs.get(job_id)
+            if job is None:
+                continue
+            new_thumbnails = [path for path in thumbnails if path not in job["thumbnails"]]
+            job["status"] = status
+            job["progress"] = progress
+            job["results"] = results
+            job["thumbnails"] = thumbnails
+            job["error"] = error
+            finished = status in (DONE, FAILED, CANCELLED)
+            on_image = image_callbacks.get(job_id)
+            if finished:
+                image_callbacks.pop(job_id, None)
+            callback = job_callbacks.pop(job_id, None) if finished else None
+            snapshot = dict(job)
+
+        # Previews are pushed one by one as each image lands
+        if on_image:
+            for thumbnail in new_thumbnails:
+                try:
+                    on_image(thumbnail)
+                except Exception as e:
+                    print(f"[ImageWorker Error] {e}")
+
+        if callback:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                print(f"[ImageWorker Error] {e}")
+
+
+def StartImageWorker():
+    """Start the long-lived image worker process if it isn't running yet."""
+    global worker_process, command_queue, event_queue, event_listener_thread
+
+    if worker_process is not None and worker_process.is_alive():
         return
 
-    # Reset status BEFORE generation to avoid accidental re-triggering
-    try:
-        with open(data_file, "w", encoding="utf-8") as f:
-            f.write("False, False")
-    except Exception as e:
-        print(f"Warning: Failed to reset ImageGeneration.data: {e}")
+    command_queue = multiprocessing.Queue()
+    event_queue = multiprocessing.Queue()
+    worker_process = multiprocessing.Process(
+        target=worker_main, args=(command_queue, event_queue), name="ImageWorker", daemon=True
+    )
+    worker_process.start()
+
+    event_listener_thread = threading.Thread(target=listen_for_events, daemon=True)
+    event_listener_thread.start()
+    print("\033[92mImage worker process started\033[0m")
+
+
+def SubmitImageJob(prompt, size="1024x1024", refresh=False, callback=None, on_image=None):
+    """Queue an image job and return its job ID; on_image(thumbnail_path) runs as each
+    image lands and callback(job) runs when the job finishes."""
+    StartImageWorker()
+
+    job_id = next(job_ids)
+    with jobs_lock:
+        jobs[job_id] = {
+            "job_id": job_id,
+            "prompt": prompt,
+            "size": size,
+            "status": QUEUED,
+            "progress": 0,
+            "results": [],
+            "thumbnails": [],
+            "error": None
+        }
+        if callback:
+            job_callbacks[job_id] = callback
+        if on_image:
+            image_callbacks[job_id] = on_image
+
+    command_queue.put(("submit", {"job_id": job_id, "prompt": prompt, "size": size, "refresh": refresh}))
+    return job_id
+
+
+def GetImageJob(job_id):
+    """Snapshot of a job's status, progress (finished images), result and thumbnail paths and
+    error message (set when it FAILED), or None."""
+    with jobs_lock:
+        job = jobs.get(job_id)
+        return dict(job) if job else None
+
+
+def CancelImageJob(job_id):
+    """Cancel a queued or running job."""
+    if command_queue is not None:
+        command_queue.put(("cancel", job_id))
+
+
+def CancelAllImageJobs():
+    """Cancel every queued and running job."""
+    if command_queue is not None:
+        command_queue.put(("cancel_all",))
+
+
+def StopImageWorker():
+    """Ask the worker process to exit after its current job."""
+    global worker_process
+
+    if worker_process is not None and worker_process.is_alive():
+        command_queue.put(("shutdown",))
+        worker_process.join(timeout=5)
+        if worker_process.is_alive():
+            worker_process.terminate()
+    worker_process = None
 
-    print(f"Generating Images with size {size} and prompt: {prompt}")
-    GenerateImages(prompt, size)
 
 if __name__ == "__main__":
-    main()
+    multiprocessing.freeze_support()
+
+    # --refresh generates new images even if the prompt is already cached
+    refresh = "--refresh" in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != "--refresh"]
+    if not args:
+        sys.exit("Usage: python Backend/ImageWorker.py <prompt> [size] [--refresh]")
+
+    done = threading.Event()
+    SubmitImageJob(
+        args[0],
+        args[1] if len(args) > 1 else "1024x1024",
+        refresh,
+        callback=lambda job: (print(f"Job {job['job_id']} {job['status']}: {job['results']}"), done.set())
+    )
+    done.wait()
+    StopImageWorker()
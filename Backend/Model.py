@@ -1,34 +1,29 @@
 import cohere  # Import the Cohere library for AI services.
 from rich import print  # Import the Rich library to enhance terminal outputs.
-from dotenv import dotenv_values  # Import dotenv to load environment variables.
+from Backend.Config import config  # Import the shared configuration read from the .env file.
+from Backend.Commands import MatchCommand  # Import the command registry to recognize task keywords.
 
-import sys
-import os
+co = None
 
-def resource_path(relative_path):
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+# The Cohere client, created on the first decision rather than at import.
+def CohereClient():
+    global co
+    if co is None:
+        co = cohere.Client(api_key=config.get("CohereAPIKey"))
+    return co
 
+# Retrieve the model; a new API key drops the client so the next decision creates it again.
+def ApplySettings(changes=None):
+    global CohereModel, co
 
-# Load environment variables from the .env file.
-env_vars = dotenv_values(resource_path(".env"))
+    CohereModel = config.get("CohereModel")
 
-# Retrieve API key.
-CohereAPIKey = env_vars.get("CohereAPIKey")
-CohereModel = env_vars.get("CohereModel")
+    if "CohereAPIKey" in (changes or {}):
+        co = None
 
-# Create a Cohere client using the provided API key.
-co = cohere.Client(api_key=CohereAPIKey)
+ApplySettings()
+config.subscribe(("CohereAPIKey", "CohereModel"), ApplySettings)
 
-# Define a list of recognized function keywords for task categorization.
-funcs = [
-    "exit", "general", "realtime", "open", "close", "play",
-    "generate image", "system", "content", "google search",
-    "youtube search", "reminder", "send message", "whatsapp call" , "video call"
-]
 
 
 # Initialize an empty list to store user messages.
@@ -46,6 +41,7 @@ You will decide whether a query is a 'general' query, a 'realtime' query, or is
 -> Respond with 'close (application name)' if a query is asking to close any application like 'close notepad', 'close facebook', etc. but if the query is asking to close multiple applications or websites, respond with 'close 1st application name, close 2nd application name' and so on.
 -> Respond with 'play (song name)' if a query is asking to play any song like 'play afsanay by ys', 'play let her go', etc. but if the query is asking to play multiple songs, respond with 'play 1st song name, play 2nd song name' and so on.
 -> Respond with 'generate image (image prompt)' if a query is requesting to generate a image with given prompt like 'generate image of a lion', 'generate image of a cat', etc. but if the query is asking to generate multiple images, respond with 'generate image 1st image prompt, generate image 2nd image prompt' and so on.
+-> Respond with 'regenerate image (image prompt)' if a query is asking for new or different images of a prompt that was already generated like 'generate new images of a lion', 'give me different pictures of the cat' respond with 'regenerate image of a lion', 'regenerate image of a cat'.
 -> Respond with 'reminder (datetime with message)' if a query is requesting to set a reminder like 'set a reminder at 9:00pm on 25th june for my business meeting.' respond with 'reminder 9:00pm 25th june business meeting'.
 -> Respond with 'system (task name)' if a query is asking to mute, unmute, volume up, volume down , etc. but if the query is asking to do multiple tasks, respond with 'system 1st task, system 2nd task', etc.
 -> Respond with 'send message (query)' if a query is asking to send a message like 'send message to mom i will be late today.', 'send message to dad' , 'send message to ritik' ,  etc. but if the query is asking to send multiple messages, respond with 'send message 1st contact name 1st message, send message 2nd contact name 2nd message' and so on.
@@ -116,7 +112,7 @@ def FirstLayerDMM(prompt: str = "test"):
     messages.append({"role": "user", "content": f"{prompt}"})
 
     # Create a streaming chat session with the Cohere model.
-    stream = co.chat_stream(
+    stream = CohereClient().chat_stream(
         model=CohereModel,  # Specify the Cohere model to use.
         message=prompt,          # Pass the user's query.
         temperature=0.7,         # Set the creativity level of the model.
@@ -138,15 +134,8 @@ def FirstLayerDMM(prompt: str = "test"):
     response = response.split(",")
 
     response = [i.strip() for i in response]
-    # Initialize empty list
-    temp =[]
-
-    for task in response:
-        for func in funcs:
-            if task.startswith(func):
-                temp.append(task)
-    # Update the response with the filtered list of tasks.
-    response = temp
+    # Keep only the tasks that start with a known command (see Backend/Commands.py).
+    response = [task for task in response if MatchCommand(task)[0] is not None]
     
     if response == []:
         response = [f"general {prompt}"]
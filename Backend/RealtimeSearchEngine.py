@@ -2,7 +2,7 @@ from googlesearch import search
 from groq import Groq # Importing the Groq library to use its API.
 from json import load, dump # Importing functions to read and write JSON files.
 import datetime # Importing the datetime module for real-time date and time information.
-from dotenv import dotenv_values #Importing dotenv values to read environment variables from a .env file.
+from Backend.Config import config #Importing the shared configuration read from the .env file.
 import os
 
 from duckduckgo_search import DDGS
@@ -14,20 +14,38 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-#Load environment variables from the env file.
-env_vars = dotenv_values(resource_path(".env"))
+client = None
 
-#Retrieve environment variables for the chatbot configuration.
-Username = env_vars.get("Username")
-Assistantname = env_vars.get("Assistantname")
-GroqAPIKey = env_vars.get("GroqAPIKey")
-GroqModel = env_vars.get("GroqModel")
+# The Groq client, created on the first search rather than at import.
+def GroqClient():
+    global client
+    if client is None:
+        client = Groq(api_key=config.get("GroqAPIKey"))
+    return client
 
-# Initialize the Groq client with the provided API key.
-client = Groq(api_key=GroqAPIKey)
+#Retrieve the chatbot configuration; a new key drops the client so the next search creates it again.
+def ApplySettings(changes=None):
+    global Username, Assistantname, GroqModel, System, SystemChatBot, client
 
-# Define the system instructions for the chatbot.
-System = f"""{Assistantname} is an AI with real-time Google data. Respond clearly, professionally, and under 100 words. Always state info is real-time. No disclaimers, no suggestions — just direct, accurate answers."""
+    Username = config.get("Username")
+    Assistantname = config.get("Assistantname")
+    GroqModel = config.get("GroqModel")
+
+    if "GroqAPIKey" in (changes or {}):
+        client = None
+
+    # Define the system instructions for the chatbot.
+    System = f"""{Assistantname} is an AI with real-time Google data. Respond clearly, professionally, and under 100 words. Always state info is real-time. No disclaimers, no suggestions — just direct, accurate answers."""
+
+    # Predefined chatbot conversation system message and an initial user message.
+    SystemChatBot = [
+        {"role": "system", "content": System},
+        {"role": "user", "content": "Hi"},
+        {"role": "assistant", "content": "Hello, how can I help you?"}
+    ]
+
+ApplySettings()
+config.subscribe(("Username", "Assistantname", "GroqAPIKey", "GroqModel"), ApplySettings)
 
 # Try to load the chat log from a JSON file, or create an empty one if it
 try:
@@ -60,13 +78,6 @@ def AnswerModifier (Answer):
     modified_answer = '\n'.join(non_empty_lines)
     return modified_answer
 
-# Predefined chatbot conversation system message and an initial user message.
-SystemChatBot = [
-    {"role": "system", "content": System},
-    {"role": "user", "content": "Hi"},
-    {"role": "assistant", "content": "Hello, how can I help you?"}
-]
-
 # Function to get real-time information like the current date and time.
 def Information():
     data = ""
@@ -104,7 +115,7 @@ def RealtimeSearchEngine(prompt):
     system_message = Information() + "\nUse the following search results to answer the user's query:\n" + search_data
     suspie = SystemChatBot + [{"role": "system", "content": system_message}] + messages
 
-    completion = client.chat.completions.create(
+    completion = GroqClient().chat.completions.create(
         model=GroqModel,
         messages=suspie,
         temperature=0.7,
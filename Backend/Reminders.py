@@ -0,0 +1,238 @@
+# Backend/Reminders.py
+
+import heapq
+import os
+import re
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timedelta
+from time import time
+from Backend.Config import config
+
+
+def resource_path(relative_path):
+    try:
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
+
+
+RemindersDB = config.get("RemindersDB") or resource_path("Data/Reminders.db")
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12
+}
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+UNITS = {"minute": 60, "min": 60, "hour": 3600, "hr": 3600, "day": 86400, "week": 604800}
+
+MONTH_NAME = r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?"
+PATTERNS = {
+    "relative": re.compile(r"\b(?:in|after)\s+(\d+|an?|one)\s+(minute|min|hour|hr|day|week)s?\b"),
+    "time": re.compile(r"\b(?:at\s+)?(\d{1,2})(?::(\d{2}))?\s*(am|pm|a\.m\.|p\.m\.)(?!\w)|\b(?:at\s+)?(\d{1,2}):(\d{2})\b"),
+    "day_month": re.compile(r"\b(?:on\s+)?(?:the\s+)?(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?" + MONTH_NAME + r"(?:\s+(\d{4}))?\b"),
+    "month_day": re.compile(r"\b(?:on\s+)?" + MONTH_NAME + r"\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?\b"),
+    "weekday": re.compile(r"\b(?:on\s+|next\s+)?(" + "|".join(WEEKDAYS) + r")\b"),
+    "named_day": re.compile(r"\b(today|tonight|tomorrow)\b"),
+}
+DEFAULT_HOUR = 9
+FILLER = re.compile(r"^(?:(?:remind(?:er)?|me|to|for|about|that|of|at|on|set|a)\s+)+|(?:\s+(?:at|on|for|to))+$")
+
+
+def ParseReminder(text, now=None):
+    """Split a reminder like '9:00pm 25th june business meeting' into (due datetime, message).
+
+    Understands clock times (9pm, 21:30), dates (25th june, june 25, today,
+    tomorrow, weekdays) and offsets (in 10 minutes). Returns (None, text) if no
+    time can be found.
+    """
+    now = now or datetime.now()
+    rest = text.lower()
+    found = {}
+
+    for name, pattern in PATTERNS.items():
+        match = pattern.search(rest)
+        if match:
+            found[name] = match
+            rest = rest[:match.start()] + " " + rest[match.end():]
+
+    if not found:
+        return None, text
+
+    message = FILLER.sub("", " ".join(rest.split())).strip(" ,.")
+
+    if "relative" in found:
+        amount, unit = found["relative"].groups()
+        amount = 1 if amount in ("a", "an", "one") else int(amount)
+        return now + timedelta(seconds=amount * UNITS[unit]), message
+
+    date = now.date()
+    explicit_date = True
+    year_given = False
+    if "day_month" in found or "month_day" in found:
+        if "day_month" in found:
+            day, month, year = found["day_month"].groups()
+        else:
+            month, day, year = found["month_day"].groups()
+        year_given = year is not None
+        try:
+            date = date.replace(year=int(year) if year else date.year, month=MONTHS[month[:3]], day=int(day))
+        except ValueError:
+            return None, text
+    elif "weekday" in found:
+        days_ahead = (WEEKDAYS.index(found["weekday"].group(1)) - date.weekday()) % 7 or 7
+        date = date + timedelta(days=days_ahead)
+    elif "named_day" in found and found["named_day"].group(1) == "tomorrow":
+        date = date + timedelta(days=1)
+    else:
+        explicit_date = False
+
+    hour, minute = DEFAULT_HOUR, 0
+    if "time" in found:
+        h12, m12, meridiem, h24, m24 = found["time"].groups()
+        if h12:
+            hour, minute = int(h12) % 12, int(m12 or 0)
+            if meridiem.startswith("p"):
+                hour += 12
+        else:
+            hour, minute = int(h24), int(m24)
+    elif "named_day" in found and found["named_day"].group(1) == "tonight":
+        hour = 21
+
+    try:
+        due = datetime.combine(date, datetime.min.time()).replace(hour=hour, minute=minute)
+    except ValueError:
+        return None, text
+
+    # A bare time that has passed means tomorrow; a date without a year that has passed means next year
+    if due <= now and not explicit_date:
+        due += timedelta(days=1)
+    elif due <= now and ("day_month" in found or "month_day" in found) and not year_given:
+        try:
+            due = due.replace(year=due.year + 1)
+        except ValueError:
+            pass
+    return due, message
+
+
+class ReminderStore:
+    """SQLite table of reminders; due times are Unix timestamps"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.con = sqlite3.connect(path, check_same_thread=False)
+        with self.con:
+            self.con.execute('''
+                CREATE TABLE IF NOT EXISTS reminders (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    due REAL NOT NULL,
+                    message TEXT,
+                    created REAL,
+                    delivered INTEGER DEFAULT 0
+                )
+            ''')
+            self.con.execute("CREATE INDEX IF NOT EXISTS idx_reminders_pending ON reminders (delivered, due)")
+
+    def add(self, due, message):
+        with self.lock, self.con:
+            cursor = self.con.execute(
+                "INSERT INTO reminders (due, message, created) VALUES (?, ?, ?)", (due, message, time())
+            )
+            return cursor.lastrowid
+
+    def pending(self):
+        with self.lock:
+            return self.con.execute("SELECT id, due, message FROM reminders WHERE delivered = 0").fetchall()
+
+    def mark_delivered(self, reminder_id):
+        with self.lock, self.con:
+            self.con.execute("UPDATE reminders SET delivered = 1 WHERE id = ?", (reminder_id,))
+
+
+class ReminderScheduler:
+    """One thread delivering reminders from a heap ordered by due time.
+
+    The thread sleeps on a condition until the earliest reminder is due or a
+    new one is added, so thousands of reminders cost nothing while waiting.
+    Reminders that came due while the assistant was off are delivered on start.
+    """
+
+    def __init__(self, store, deliver):
+        self.store = store
+        self.deliver = deliver
+        self.heap = []
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+
+    def start(self):
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+            self.heap = [(due, reminder_id, message) for reminder_id, due, message in self.store.pending()]
+            heapq.heapify(self.heap)
+        self.thread = threading.Thread(target=self.run, name="Reminders", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+
+    def add(self, due, message):
+        reminder_id = self.store.add(due, message)
+        with self.condition:
+            heapq.heappush(self.heap, (due, reminder_id, message))
+            self.condition.notify()
+        return reminder_id
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.running and (not self.heap or self.heap[0][0] > time()):
+                    self.condition.wait(timeout=self.heap[0][0] - time() if self.heap else None)
+                if not self.running:
+                    return
+                due, reminder_id, message = heapq.heappop(self.heap)
+
+            try:
+                self.deliver({"id": reminder_id, "due": due, "message": message})
+            except Exception as e:
+                print(f"[Reminder Error] {e}")
+            self.store.mark_delivered(reminder_id)
+
+
+reminder_scheduler = None
+reminder_lock = threading.Lock()
+
+
+def StartReminders(deliver):
+    """Start the reminder thread; deliver(reminder) is called with each reminder as it comes due"""
+    global reminder_scheduler
+
+    with reminder_lock:
+        if reminder_scheduler is None:
+            reminder_scheduler = ReminderScheduler(ReminderStore(RemindersDB), deliver)
+        reminder_scheduler.start()
+    print("\033[92mReminder scheduler started\033[0m")
+
+
+def StopReminders():
+    if reminder_scheduler is not None:
+        reminder_scheduler.stop()
+
+
+def SetReminder(text):
+    """Parse and store a reminder decision; returns what to tell the user"""
+    due, message = ParseReminder(text)
+    if due is None:
+        return "Sorry sir, I couldn't work out when to remind you."
+    if reminder_scheduler is None:
+        return "Sorry sir, reminders aren't running right now."
+
+    reminder_scheduler.add(due.timestamp(), message or "reminder")
+    return f"Okay sir, I'll remind you {due.strftime('%A %d %B at %I:%M %p')}" + (f" about {message}." if message else ".")
@@ -0,0 +1,76 @@
+# Backend/Scheduler.py
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+# Lanes: UI tasks drive the mouse, keyboard or focused window and must run one at a
+# time; NETWORK tasks only talk to the network or spawn processes and run freely.
+UI = "ui"
+NETWORK = "network"
+
+OK = "ok"
+FAILED = "failed"
+TIMEOUT = "timeout"
+
+
+class AutomationScheduler:
+    """Runs a batch of blocking automation calls in worker threads.
+
+    Every task gets its own deadline, counted from when it starts, and a result
+    dict {"command", "lane", "status", "result", "error", "elapsed"}. UI tasks
+    queue one after another; a UI task that times out keeps the lane until its
+    thread really finishes, so two of them never fight over the screen.
+    """
+
+    def __init__(self, max_workers=8):
+        # Our own pool rather than the loop's default one: asyncio.run() waits for the
+        # default executor on shutdown, which would turn a timeout back into a hang
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Automation")
+        # Threads outlive a timed-out batch and batches may run side by side on different
+        # threads and loops, so across batches the UI lane is a thread lock
+        self.ui_thread_lock = threading.Lock()
+
+    def run_exclusive(self, func, args, on_locked):
+        with self.ui_thread_lock:
+            on_locked()
+            return func(*args)
+
+    async def run_task(self, ui_lock, command, func, args, lane, timeout):
+        loop = asyncio.get_running_loop()
+        result = {"command": command, "lane": lane, "status": OK, "result": None, "error": None, "elapsed": 0.0}
+
+        if lane == UI:
+            await ui_lock.acquire()
+            locked = asyncio.Event()
+            future = loop.run_in_executor(
+                self.executor, self.run_exclusive, func, args, lambda: loop.call_soon_threadsafe(locked.set)
+            )
+            future.add_done_callback(lambda _: ui_lock.release())
+            # The deadline starts once the task has the screen, not while it waits
+            # behind a timed-out task from another batch that is still running
+            waiter = asyncio.ensure_future(locked.wait())
+            await asyncio.wait((waiter, future), return_when=asyncio.FIRST_COMPLETED)
+            waiter.cancel()
+        else:
+            future = loop.run_in_executor(self.executor, func, *args)
+        started = perf_counter()
+
+        try:
+            result["result"] = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            result["status"] = TIMEOUT
+            result["error"] = f"no result after {timeout}s"
+        except Exception as e:
+            result["status"] = FAILED
+            result["error"] = str(e)
+        result["elapsed"] = round(perf_counter() - started, 3)
+        return result
+
+    async def run(self, tasks):
+        """Run [(command, func, args, lane, timeout)] and return their results in order"""
+        # asyncio locks belong to one event loop, so each batch queues its own UI tasks
+        # with a lock of its own; the thread lock keeps them apart from other batches
+        ui_lock = asyncio.Lock()
+        return await asyncio.gather(*(self.run_task(ui_lock, *task) for task in tasks))
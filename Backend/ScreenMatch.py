@@ -0,0 +1,128 @@
+# Backend/ScreenMatch.py
+
+import threading
+import time
+import numpy as np
+import pyautogui
+from PIL import Image
+
+
+def WaitFor(condition, timeout=10, interval=0.1):
+    """Poll condition() until it returns something truthy; that value, or None after timeout"""
+    deadline = time.monotonic() + timeout
+    while True:
+        value = condition()
+        if value:
+            return value
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(interval)
+
+
+def ActiveWindowTitle():
+    try:
+        window = pyautogui.getActiveWindow()
+        return window.title if window else ""
+    except Exception:
+        return ""
+
+
+def WaitForWindow(title, timeout=15, interval=0.1):
+    """Wait until the focused window's title contains title"""
+    return WaitFor(lambda: title.lower() in ActiveWindowTitle().lower(), timeout, interval)
+
+
+def to_gray(image, scale):
+    image = image.convert("L")
+    if scale != 1:
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(size, Image.BILINEAR)
+    return np.asarray(image, dtype=np.float32)
+
+
+def window_sums(image, height, width):
+    """Sum of every height x width window of image, via a summed-area table"""
+    table = np.pad(image, ((1, 0), (1, 0))).cumsum(0).cumsum(1)
+    return table[height:, width:] - table[:-height, width:] - table[height:, :-width] + table[:-height, :-width]
+
+
+def match_template(haystack, needle):
+    """Normalized cross-correlation of needle at every position of haystack; (score, x, y) of the best"""
+    h, w = needle.shape
+    if haystack.shape[0] < h or haystack.shape[1] < w:
+        return 0.0, 0, 0
+
+    needle = needle - needle.mean()
+    needle_norm = np.sqrt((needle ** 2).sum())
+    if needle_norm == 0:
+        return 0.0, 0, 0
+
+    # Correlation for all offsets at once through the FFT
+    shape = (haystack.shape[0] + h - 1, haystack.shape[1] + w - 1)
+    product = np.fft.irfft2(np.fft.rfft2(haystack, shape) * np.fft.rfft2(needle[::-1, ::-1], shape), shape)
+    correlation = product[h - 1:haystack.shape[0], w - 1:haystack.shape[1]]
+
+    count = h * w
+    sums = window_sums(haystack, h, w)
+    variance = window_sums(haystack ** 2, h, w) - sums ** 2 / count
+    scores = correlation / (np.sqrt(np.maximum(variance, 1e-6)) * needle_norm)
+
+    y, x = np.unravel_index(np.argmax(scores), scores.shape)
+    return float(scores[y, x]), int(x), int(y)
+
+
+class TemplateLocator:
+    """Finds a small UI element (a PNG cut from a screenshot) on screen.
+
+    The whole screen is searched on a downscaled grayscale screenshot. Where a
+    template was last found is remembered, and that area (with some margin) is
+    checked first at full resolution, which is both faster and more precise.
+    """
+
+    Scale = 0.5
+    Threshold = 0.7
+    Margin = 40
+
+    regions = {}
+    regions_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        template = Image.open(path)
+        self.size = template.size
+        self.full = to_gray(template, 1)
+        self.small = to_gray(template, self.Scale)
+
+    def search(self, region, template, scale):
+        left, top = region[0], region[1]
+        screenshot = pyautogui.screenshot(region=region)
+        score, x, y = match_template(to_gray(screenshot, scale), template)
+        if score < self.Threshold:
+            return None
+        return (left + round(x / scale), top + round(y / scale), self.size[0], self.size[1])
+
+    def locate(self):
+        """(left, top, width, height) of the template on screen, or None"""
+        with self.regions_lock:
+            last = self.regions.get(self.path)
+
+        box = None
+        if last:
+            screen_w, screen_h = pyautogui.size()
+            left = max(0, last[0] - self.Margin)
+            top = max(0, last[1] - self.Margin)
+            right = min(screen_w, last[0] + last[2] + self.Margin)
+            bottom = min(screen_h, last[1] + last[3] + self.Margin)
+            box = self.search((left, top, right - left, bottom - top), self.full, 1)
+
+        if box is None:
+            screen_w, screen_h = pyautogui.size()
+            box = self.search((0, 0, screen_w, screen_h), self.small, self.Scale)
+
+        if box is not None:
+            with self.regions_lock:
+                self.regions[self.path] = box
+        return box
+
+    def wait(self, timeout=10, interval=0.2):
+        return WaitFor(self.locate, timeout, interval)
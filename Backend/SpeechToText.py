@@ -3,7 +3,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
-from dotenv import dotenv_values
+from Backend.Config import config
 import os
 import mtranslate as mt
 from selenium.webdriver.support.ui import WebDriverWait
@@ -11,6 +11,11 @@ from selenium.webdriver.support import expected_conditions as EC
 import sys
 import threading
 import time
+import re
+import html
+from collections import OrderedDict
+from queue import Queue, Empty
+import requests
 from groq import Groq
 
 
@@ -22,29 +27,53 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
-# Load environment variables from the .env file.
-env_vars = dotenv_values(resource_path(".env"))
-# Get the input language setting from the environment variables, default to "en" if not set.
-InputLanguage = env_vars.get("InputLanguage", "en")
+# Get the input language setting from the configuration, "en" if not set.
+InputLanguage = config.get("InputLanguage")
 
-# Get Groq API key for stop command analysis
-GROQ_API_KEY = env_vars.get("GroqAPIKey", "")
-GroqModel = env_vars.get("GroqModel", "")
+# Groq model for stop command analysis
+GroqModel = config.get("GroqModel")
 
-# Initialize Groq client
-if GROQ_API_KEY:
-    groq_client = Groq(api_key=GROQ_API_KEY)
-else:
-    print("\033[93mWarning: GROQ_API_KEY not found in .env file. Stop detection will be basic.\033[0m")
-    groq_client = None
+def CheckGroqKey():
+    if not config.get("GroqAPIKey"):
+        print("\033[93mWarning: GROQ_API_KEY not found in .env file. Stop detection will be basic.\033[0m")
+
+def GroqClient():
+    """Groq client for stop command analysis, created on first use; None without an API key"""
+    global groq_client
+    if groq_client is None and config.get("GroqAPIKey"):
+        groq_client = Groq(api_key=config.get("GroqAPIKey"))
+    return groq_client
+
+# The client itself waits for the first stop command
+groq_client = None
+CheckGroqKey()
 
 # Global variables for continuous listening control
 listening_active = False
 driver = None
 
+# Translation layer: LRU cache of (text, source language) -> English, a keep-alive
+# HTTP session and a worker thread so translation never blocks the capture loop.
+TranslationCacheSize = config.get("TranslationCacheSize")
+TranslationURL = "https://translate.google.com/m"
+translation_cache = OrderedDict()
+translation_lock = threading.Lock()
+translation_session = requests.Session()
+translation_session.headers.update({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"})
+translation_queue = Queue()
+translation_worker_thread = None
+# Bumped by every stop; a translation started under an older generation is dropped
+# instead of overwriting the stop marker in input.txt.
+translation_generation = 0
+
 # Debugging print to check if InputLanguage is loaded correctly.
 print(f"Input Language: {InputLanguage}")
 
+# Endpointing: an utterance is committed once the recognizer has been silent for
+# EndpointSilenceMs, or its hypothesis hasn't changed for EndpointStableMs.
+EndpointSilenceMs = config.get("EndpointSilenceMs")
+EndpointStableMs = config.get("EndpointStableMs")
+
 # Define the HTML code for the speech recognition interface.
 HtmlCode = '''<!DOCTYPE html>
 <html lang="en">
@@ -54,50 +83,160 @@ HtmlCode = '''<!DOCTYPE html>
 <body>
     <button id="start" onclick="startRecognition()">Start Recognition</button>
     <button id="end" onclick="stopRecognition()">Stop Recognition</button>
-    <p id="output"></p>
+    <p id="interim"></p>
+    <p id="output" data-turn="0"></p>
     <script>
         const output = document.getElementById('output');
+        const interim = document.getElementById('interim');
+        const SILENCE_MS = 700;
+        const STABLE_MS = 1200;
         let recognition;
+        let turn = 0;
+        let hypothesis = "";
+        let finalText = "";
+        let lastResultAt = 0;
+        let lastChangeAt = 0;
+        let draining = false;
+        let endpointTimer = null;
+        let language = '';
+
+        function resetHypothesis() {
+            hypothesis = "";
+            finalText = "";
+            interim.textContent = "";
+        }
+
+        function commitUtterance() {
+            const text = hypothesis.trim();
+            resetHypothesis();
+            if (!text) {
+                return;
+            }
+            turn += 1;
+            output.textContent = text;
+            output.dataset.turn = turn;
+            // Let the engine finalize what it already heard in a fresh session and
+            // ignore those late results, so one spoken turn commits exactly once.
+            draining = true;
+            recognition.stop();
+        }
+
+        function checkEndpoint() {
+            if (!recognition || draining || !hypothesis.trim()) {
+                return;
+            }
+            const now = Date.now();
+            if (now - lastResultAt >= SILENCE_MS || now - lastChangeAt >= STABLE_MS) {
+                commitUtterance();
+            }
+        }
 
         function startRecognition() {
             recognition = new webkitSpeechRecognition() || new SpeechRecognition();
-            recognition.lang = '';
+            recognition.lang = language;
             recognition.continuous = true;
+            recognition.interimResults = true;
 
             recognition.onresult = function(event) {
-                const transcript = event.results[event.results.length - 1][0].transcript;
-                output.textContent = transcript;
+                if (draining) {
+                    return;
+                }
+                let pending = "";
+                for (let i = event.resultIndex; i < event.results.length; i++) {
+                    if (event.results[i].isFinal) {
+                        finalText += event.results[i][0].transcript;
+                    } else {
+                        pending += event.results[i][0].transcript;
+                    }
+                }
+                const now = Date.now();
+                const next = (finalText + pending).trim();
+                if (next !== hypothesis) {
+                    hypothesis = next;
+                    lastChangeAt = now;
+                }
+                lastResultAt = now;
+                interim.textContent = hypothesis;
             };
 
             recognition.onend = function() {
+                draining = false;
+                resetHypothesis();
                 if (recognition) {
                     recognition.start();
                 }
             };
             recognition.start();
+            endpointTimer = setInterval(checkEndpoint, 50);
         }
 
         function stopRecognition() {
             if (recognition) {
-                recognition.stop();
+                const active = recognition;
                 recognition = null;
+                active.stop();
             }
+            clearInterval(endpointTimer);
+            resetHypothesis();
             output.innerHTML = "";
         }
         
         function clearOutput() {
             output.innerHTML = "";
         }
+
+        function setLanguage(lang) {
+            language = lang;
+            if (recognition) {
+                // Drop what was heard in the old language; onend restarts in the new one
+                recognition.lang = lang;
+                draining = true;
+                recognition.stop();
+            }
+        }
     </script>
 </body>
 </html>'''
 
-# Replace the language setting in the HTML code with the input language from the environment variables.
-HtmlCode = str(HtmlCode).replace("recognition.lang = '';", f"recognition.lang = '{InputLanguage}';")
+def VoicePage():
+    """The recognition page with the current language and endpointing settings filled in"""
+    page = HtmlCode.replace("let language = '';", f"let language = '{InputLanguage}';")
+    page = page.replace("const SILENCE_MS = 700;", f"const SILENCE_MS = {EndpointSilenceMs};")
+    return page.replace("const STABLE_MS = 1200;", f"const STABLE_MS = {EndpointStableMs};")
+
+# Language switch waiting for the listening loop; the WebDriver session is only ever
+# used from that loop's thread, never from the config watcher.
+pending_language = None
+
+def ApplySettings(changes):
+    """Queue a language switch for the running page, so Chrome keeps running;
+    endpointing changes apply the next time the page is loaded."""
+    global InputLanguage, EndpointSilenceMs, EndpointStableMs, GroqModel, groq_client, pending_language
+
+    EndpointSilenceMs = config.get("EndpointSilenceMs")
+    EndpointStableMs = config.get("EndpointStableMs")
+    GroqModel = config.get("GroqModel")
+    if "GroqAPIKey" in changes:
+        groq_client = None
+        CheckGroqKey()
+
+    if "InputLanguage" in changes:
+        InputLanguage = config.get("InputLanguage")
+        print(f"Input Language: {InputLanguage}")
+        pending_language = InputLanguage
+
+def ApplyPendingLanguage():
+    """Called by the recognition loops between their own driver calls"""
+    global pending_language
+
+    language, pending_language = pending_language, None
+    if language and driver:
+        try:
+            driver.execute_script("setLanguage(arguments[0]);", language)
+        except Exception as e:
+            print(f"Error switching recognition language: {e}")
 
-# Write the modified HTML code to a file.
-with open(resource_path(r"DataVoice.html"), "w") as f:
-    f.write(HtmlCode)
+config.subscribe(("InputLanguage", "EndpointSilenceMs", "EndpointStableMs", "GroqAPIKey", "GroqModel"), ApplySettings)
 
 # Get the current working directory.
 current_dir = getattr(sys, '_MEIPASS', os.path.abspath("."))
@@ -116,17 +255,16 @@ chrome_options.add_argument("--headless")
 chrome_options.add_argument("--disable-gpu")
 chrome_options.add_argument("--window-size=1920x1080")
 
-# Initialize the Chrome WebDriver using the ChromeDriverManager.
-service = Service(ChromeDriverManager().install())
+# The ChromeDriver service is resolved (and downloaded if needed) when the driver first starts.
+service = None
 
 # Define the path for temporary files.
 TempDirPath = rf"{current_dir}/Frontend/Files"
 
 def analyze_stop_command(text):
     """Use Groq API to analyze if the stop command is meant for the assistant"""
-    global groq_client
-    
-    if not groq_client:
+    client = GroqClient()
+    if not client:
         # Fallback to basic detection if no API key
         return 'stop' in text.lower() and ('jarvis' in text.lower() or 'assistant' in text.lower())
     
@@ -147,7 +285,7 @@ def analyze_stop_command(text):
         Respond with only "TRUE" if this is a command to stop the assistant, or "FALSE" if it's just normal conversation containing the word "stop" but not meant as a command.
         """
         
-        response = groq_client.chat.completions.create(
+        response = client.chat.completions.create(
             messages=[{"role": "user", "content": prompt}],
             model=GroqModel,
             temperature=0.1,
@@ -203,17 +341,107 @@ def QueryModifier(Query):
             new_query += '.'
     return new_query
 
+def TranslateOverSession(Text, ToLanguage="en", FromLanguage="auto"):
+    """Translate text with the same endpoint mtranslate uses, over a pooled connection."""
+    response = translation_session.get(
+        TranslationURL,
+        params={"tl": ToLanguage, "sl": FromLanguage, "q": Text},
+        timeout=5
+    )
+    response.raise_for_status()
+    match = re.search(r'(?s)class="(?:t0|result-container)">(.*?)<', response.text)
+    if not match:
+        raise ValueError("No translation found in response")
+    return html.unescape(match.group(1))
+
 def UniversalTranslator(Text):
-    """Function to translate text into English using the mtranslate library."""
+    """Function to translate text into English, memoized per (text, source language)."""
+    key = (" ".join(Text.lower().split()), InputLanguage.lower())
+
+    with translation_lock:
+        if key in translation_cache:
+            translation_cache.move_to_end(key)
+            return translation_cache[key]
+
     try:
-        english_translation = mt.translate(Text, "en", "auto")
-        return english_translation.capitalize()
-    except:
-        return Text.capitalize()
+        english_translation = TranslateOverSession(Text)
+    except Exception:
+        try:
+            english_translation = mt.translate(Text, "en", "auto")
+        except:
+            # Don't cache failures, the next attempt may succeed.
+            return Text.capitalize()
+
+    english_translation = english_translation.capitalize()
+
+    with translation_lock:
+        translation_cache[key] = english_translation
+        translation_cache.move_to_end(key)
+        while len(translation_cache) > TranslationCacheSize:
+            translation_cache.popitem(last=False)
+
+    return english_translation
+
+def translation_worker():
+    """Worker thread that translates queued utterances and writes them to input.txt"""
+    while True:
+        generation, text = translation_queue.get()
+        try:
+            # input.txt only holds one query, so a burst collapses to its latest utterance
+            # just like the browser output element did while translation used to block.
+            while True:
+                try:
+                    generation, text = translation_queue.get_nowait()
+                    translation_queue.task_done()
+                except Empty:
+                    break
+
+            SetAssistantStatus('Translating ...')
+            query = QueryModifier(UniversalTranslator(text))
+            # Checked and written under the lock, so a stop can't slip in between
+            with translation_lock:
+                if generation != translation_generation:
+                    print(f"\033[93mDropped translation of '{text}' after a stop\033[0m")
+                    continue
+                WriteToInputFile(query)
+        except Exception as e:
+            print(f"Error in translation worker: {e}")
+        finally:
+            translation_queue.task_done()
+
+def start_translation_worker():
+    """Start the translation worker thread if it isn't running yet."""
+    global translation_worker_thread
+
+    if translation_worker_thread is None or not translation_worker_thread.is_alive():
+        translation_worker_thread = threading.Thread(target=translation_worker, daemon=True)
+        translation_worker_thread.start()
+
+def clear_translation_queue():
+    """Drop utterances that are waiting to be translated or are being translated right now."""
+    global translation_generation
+
+    with translation_lock:
+        translation_generation += 1
+    while True:
+        try:
+            translation_queue.get_nowait()
+            translation_queue.task_done()
+        except Empty:
+            break
 
 def InitializeWebDriver():
     """Initialize the web driver and open the HTML file."""
-    global driver
+    global driver, service
+
+    # Write the modified HTML code to a file.
+    with open(resource_path(r"DataVoice.html"), "w") as f:
+        f.write(VoicePage())
+
+    # Initialize the Chrome WebDriver using the ChromeDriverManager.
+    if service is None:
+        service = Service(ChromeDriverManager().install())
+
     driver = webdriver.Chrome(service=service, options=chrome_options)
     driver.get(Link)
     return driver
@@ -232,37 +460,43 @@ def StartContinuousListening():
     try:
         WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.ID, "start"))).click()
         
-        last_text = ""
+        last_turn = driver.execute_script("return document.getElementById('output').dataset.turn;")
         while listening_active:
             try:
-                # Get the recognized text from the HTML output element
-                current_text = driver.find_element(by=By.ID, value="output").text.strip()
+                ApplyPendingLanguage()
+
+                # Get the last committed utterance and its turn number from the page
+                turn, current_text = driver.execute_script(
+                    "const o = document.getElementById('output'); return [o.dataset.turn, o.textContent];"
+                )
+                current_text = current_text.strip()
                 
-                if current_text and current_text != last_text:
+                # Each endpointed turn is forwarded exactly once
+                if current_text and turn != last_turn:
+                    last_turn = turn
                     print(f"\033[96mHeard: {current_text}\033[0m")
                     
                     # Check if it's a stop command for the assistant
                     if analyze_stop_command(current_text):
                         print(f"\033[91mIntelligent Stop command detected: '{current_text}'\033[0m")
+                        clear_translation_queue()
                         WriteToInputFile("STOP_COMMAND_FOR_ASSISTANT")
                         # Clear the output to continue listening for new commands
                         driver.execute_script("clearOutput();")
-                        last_text = ""
                     else:
                         # Process the text normally
                         if InputLanguage.lower() == "en" or "en" in InputLanguage.lower():
                             processed_text = QueryModifier(current_text)
                             WriteToInputFile(processed_text)
                         else:
-                            SetAssistantStatus('Translating ...')
-                            translated_text = QueryModifier(UniversalTranslator(current_text))
-                            WriteToInputFile(translated_text)
+                            # Translate off the capture thread so listening continues.
+                            start_translation_worker()
+                            translation_queue.put((translation_generation, current_text))
                         
                         # Clear the output to continue listening for new commands
                         driver.execute_script("clearOutput();")
-                        last_text = ""
                 
-                time.sleep(0.1)  # Small delay to prevent excessive CPU usage
+                time.sleep(0.05)  # Small delay to prevent excessive CPU usage
                 
             except Exception as e:
                 time.sleep(0.1)
@@ -295,6 +529,8 @@ def SpeechRecognition():
 
     while True:
         try:
+            ApplyPendingLanguage()
+
             # Get the recognized text from the HTML output element
             Text = driver.find_element(by=By.ID, value="output").text
 
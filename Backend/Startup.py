@@ -0,0 +1,201 @@
+# Backend/Startup.py
+
+import builtins
+import importlib
+import json
+import os
+import sys
+import threading
+from time import perf_counter, time
+from Backend.Config import config
+
+
+def resource_path(relative_path):
+    try:
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
+
+
+# Milliseconds from the first line of main.py until the window takes input
+StartupBudgetMs = config.get("StartupBudgetMs")
+StartupHistoryPath = resource_path("Data/Startup.json")
+
+
+class ImportTimer:
+    """Times every module imported for the first time by one thread.
+
+    builtins.__import__ is wrapped while installed; times are inclusive, so a
+    module's time contains everything it imported in turn. depth 0 entries are
+    the imports written in the startup code itself.
+    """
+
+    def __init__(self):
+        self.times = []
+        self.depth = 0
+        self.thread_id = None
+        self.original = None
+
+    def install(self):
+        self.thread_id = threading.get_ident()
+        self.original = builtins.__import__
+        builtins.__import__ = self.timed_import
+
+    def uninstall(self):
+        if self.original is not None:
+            builtins.__import__ = self.original
+            self.original = None
+
+    def timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules or threading.get_ident() != self.thread_id:
+            return self.original(name, globals, locals, fromlist, level)
+
+        depth = self.depth
+        self.depth += 1
+        started = perf_counter()
+        try:
+            return self.original(name, globals, locals, fromlist, level)
+        finally:
+            self.depth = depth
+            self.times.append((name, depth, perf_counter() - started))
+
+
+class StartupProfile:
+    """Phase and import timings for one start of the assistant, checked against a budget.
+
+    Each finished start is appended to a small JSON history next to the other
+    data files, so a slow import that creeps in shows up as a trend rather than
+    a feeling.
+    """
+
+    HistorySize = 50
+    SlowestImports = 10
+
+    def __init__(self, budget_ms, history_path):
+        self.budget_ms = budget_ms
+        self.history_path = history_path
+        self.imports = ImportTimer()
+        self.started = None
+        self.phases = []
+        self.finished = False
+
+    def start(self):
+        self.started = perf_counter()
+        self.imports.install()
+
+    def mark(self, phase):
+        if self.started is not None and not self.finished:
+            self.phases.append((phase, perf_counter() - self.started))
+
+    def finish(self):
+        """Stop timing and report; returns the total startup time in ms"""
+        if self.started is None or self.finished:
+            return None
+        self.finished = True
+        total_ms = (perf_counter() - self.started) * 1000
+        self.imports.uninstall()
+        print(self.report(total_ms))
+        self.save(total_ms)
+        return total_ms
+
+    def report(self, total_ms):
+        within = total_ms <= self.budget_ms
+        colour = "\033[92m" if within else "\033[91m"
+        lines = [f"{colour}[STARTUP] Window ready in {total_ms:.0f} ms (budget {self.budget_ms} ms)\033[0m"]
+
+        previous = 0.0
+        for phase, at in self.phases:
+            lines.append(f"  {phase:<32} {(at - previous) * 1000:8.1f} ms")
+            previous = at
+
+        top_level = [entry for entry in self.imports.times if entry[1] == 0]
+        if top_level:
+            lines.append("  Imports in main.py:")
+            for name, _, elapsed in sorted(top_level, key=lambda entry: -entry[2]):
+                lines.append(f"    {name:<30} {elapsed * 1000:8.1f} ms")
+
+        if not within:
+            lines.append("  Slowest imports overall:")
+            slowest = sorted(self.imports.times, key=lambda entry: -entry[2])[:self.SlowestImports]
+            for name, _, elapsed in slowest:
+                lines.append(f"    {name:<30} {elapsed * 1000:8.1f} ms")
+        return "\n".join(lines)
+
+    def save(self, total_ms):
+        entry = {
+            "at": time(),
+            "total_ms": round(total_ms, 1),
+            "budget_ms": self.budget_ms,
+            "phases": {phase: round(at * 1000, 1) for phase, at in self.phases},
+            "imports": {name: round(elapsed * 1000, 1) for name, depth, elapsed in self.imports.times if depth == 0}
+        }
+        try:
+            with open(self.history_path, "r", encoding="utf-8") as file:
+                history = json.load(file)
+        except Exception:
+            history = []
+        history = (history + [entry])[-self.HistorySize:]
+
+        temp_path = f"{self.history_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.history_path) or ".", exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(history, file, indent=4)
+            os.replace(temp_path, self.history_path)
+        except Exception as e:
+            print(f"[ERROR] Saving startup history failed: {e}")
+
+
+class LazyFunction:
+    """Stands in for "module:function" and imports the module on the first call.
+
+    Lets main.py name backend functions at the top without paying for the
+    backend (and everything it imports and sets up) before the window is shown.
+    """
+
+    def __init__(self, handler):
+        self.module_name, self.function_name = handler.split(":")
+        self.function = None
+
+    @property
+    def loaded(self):
+        return self.module_name in sys.modules
+
+    def __call__(self, *args, **kwargs):
+        if self.function is None:
+            self.function = getattr(importlib.import_module(self.module_name), self.function_name)
+        return self.function(*args, **kwargs)
+
+
+startup_profile = StartupProfile(StartupBudgetMs, StartupHistoryPath)
+
+
+def StartProfiling():
+    startup_profile.start()
+
+
+def MarkStartup(phase):
+    startup_profile.mark(phase)
+
+
+def FinishStartup():
+    return startup_profile.finish()
+
+
+def WarmUp(modules):
+    """Import the backends one by one in a background thread, so the first command doesn't wait for them"""
+    def warm_up():
+        for module_name in modules:
+            started = perf_counter()
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                # The command that needs it will raise the real error when it runs
+                print(f"[WARMUP] {module_name} failed to load: {e}")
+                continue
+            print(f"\033[90m[WARMUP] {module_name} ready in {(perf_counter() - started) * 1000:.0f} ms\033[0m")
+
+    thread = threading.Thread(target=warm_up, name="WarmUp", daemon=True)
+    thread.start()
+    return thread
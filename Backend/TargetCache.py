@@ -0,0 +1,74 @@
+# Backend/TargetCache.py
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from time import time
+
+MISS = object()
+
+
+class TargetCache:
+    """Persistent (kind, query) -> URL cache for automation commands that scrape.
+
+    Resolved URLs live for TTL seconds. Queries that resolved to nothing are
+    remembered for NegativeTTL seconds, so repeating them skips the scrape too
+    and goes straight to the caller's fallback. Least recently used entries are
+    dropped beyond MaxEntries.
+    """
+
+    TTL = 7 * 24 * 60 * 60
+    NegativeTTL = 60 * 60
+    MaxEntries = 1000
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.load()
+
+    @staticmethod
+    def key(kind, query):
+        return f"{kind}:{' '.join(str(query).lower().split())}"
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                self.entries = OrderedDict(json.load(file))
+        except Exception:
+            pass
+
+    def save(self):
+        temp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(self.entries, file, indent=4)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"[ERROR] Saving target cache failed: {e}")
+
+    def get(self, kind, query):
+        """Cached URL, None for a remembered miss, or MISS when there is nothing fresh"""
+        key = self.key(kind, query)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return MISS
+            ttl = self.TTL if entry["url"] else self.NegativeTTL
+            if time() - entry["resolved_at"] > ttl:
+                del self.entries[key]
+                return MISS
+            self.entries.move_to_end(key)
+            return entry["url"]
+
+    def put(self, kind, query, url):
+        """Remember what a query resolved to; url=None records a miss"""
+        with self.lock:
+            key = self.key(kind, query)
+            self.entries[key] = {"url": url, "resolved_at": time()}
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.MaxEntries:
+                self.entries.popitem(last=False)
+            self.save()
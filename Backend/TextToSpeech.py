@@ -3,7 +3,7 @@ import random
 import asyncio
 import edge_tts
 import os
-from dotenv import dotenv_values
+from Backend.Config import config
 import threading
 import sys
 import time
@@ -20,27 +20,41 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
-# Load environment variables from a .env file
-env_vars = dotenv_values(resource_path(".env"))
-
-# Your Assistant Voice (default to a valid string if not found in .env)
-AssistantVoice = env_vars.get("AssistantVoice", "en-CA-liamNeural")
+# Your Assistant Voice (the config falls back to a valid voice if it is not in .env)
+AssistantVoice = config.get("AssistantVoice")
 VOICE = AssistantVoice
 
-# Get Groq API key from environment variables
-GROQ_API_KEY = env_vars.get("GroqAPIKey", "")
-GroqModel = env_vars.get("GroqModel", "")
+# Groq model for stop command analysis
+GroqModel = config.get("GroqModel")
+
+def CheckGroqKey():
+    if not config.get("GroqAPIKey"):
+        print("\033[93mWarning: GROQ_API_KEY not found in .env file. Stop detection will be basic.\033[0m")
+
+def GroqClient():
+    """Groq client for stop command analysis, created on first use; None without an API key"""
+    global groq_client
+    if groq_client is None and config.get("GroqAPIKey"):
+        groq_client = Groq(api_key=config.get("GroqAPIKey"))
+    return groq_client
 
-# Ensure AssistantVoice is a string
-if not isinstance(AssistantVoice, str) or not AssistantVoice:
-    raise ValueError("AssistantVoice must be a valid string.")
+# The client itself waits for the first stop command
+groq_client = None
+CheckGroqKey()
 
-# Initialize Groq client
-if GROQ_API_KEY:
-    groq_client = Groq(api_key=GROQ_API_KEY)
-else:
-    print("\033[93mWarning: GROQ_API_KEY not found in .env file. Stop detection will be basic.\033[0m")
-    groq_client = None
+def ApplySettings(changes):
+    """A new voice is used from the next sentence on; the mixer is set up per sentence anyway"""
+    global AssistantVoice, VOICE, GroqModel, groq_client
+
+    if "AssistantVoice" in changes:
+        AssistantVoice = VOICE = config.get("AssistantVoice")
+        print(f"\033[96mAssistant voice is now {AssistantVoice}\033[0m")
+    GroqModel = config.get("GroqModel")
+    if "GroqAPIKey" in changes:
+        groq_client = None
+        CheckGroqKey()
+
+config.subscribe(("AssistantVoice", "GroqAPIKey", "GroqModel"), ApplySettings)
 
 # Global variables for TTS queue system
 tts_queue = Queue()
@@ -49,12 +63,12 @@ current_tts_thread = None
 queue_worker_running = False
 file_monitor_thread = None
 stop_monitoring = False
+tts_start_lock = threading.Lock()
 
 def analyze_stop_command(text):
     """Use Groq API to analyze if the stop command is meant for the assistant"""
-    global groq_client
-    
-    if not groq_client:
+    client = GroqClient()
+    if not client:
         # Fallback to basic detection if no API key
         return 'stop' in text.lower() and ('jarvis' in text.lower() or 'assistant' in text.lower())
     
@@ -75,7 +89,7 @@ def analyze_stop_command(text):
         Respond with only "TRUE" if this is a command to stop the assistant, or "FALSE" if it's just normal conversation containing the word "stop" but not meant as a command.
         """
         
-        response = groq_client.chat.completions.create(
+        response = client.chat.completions.create(
             messages=[{"role": "user", "content": prompt}],
             model=GroqModel,
             temperature=0.1,
@@ -249,15 +263,19 @@ def tts_queue_worker():
     print("\033[93mTTS Queue Worker stopped\033[0m")
 
 def start_tts_queue_system():
-    """Start the TTS queue system"""
+    """Start the TTS queue system (once, on the first request to speak)"""
     global current_tts_thread
     
-    # Start file monitoring
-    start_file_monitoring()
-    
-    # Start queue worker
-    current_tts_thread = threading.Thread(target=tts_queue_worker, daemon=True)
-    current_tts_thread.start()
+    with tts_start_lock:
+        if current_tts_thread is not None:
+            return
+
+        # Start file monitoring
+        start_file_monitoring()
+        
+        # Start queue worker
+        current_tts_thread = threading.Thread(target=tts_queue_worker, daemon=True)
+        current_tts_thread.start()
 
 def TextToSpeech(text, func=lambda x=None: True):
     """Main TTS function that adds text to queue"""
@@ -292,6 +310,7 @@ def TextToSpeech(text, func=lambda x=None: True):
         final_text = text
     
     print(f"\033[92mAdding to TTS queue: '{final_text[:50]}...'\033[0m")
+    start_tts_queue_system()
     tts_queue.put(final_text)
 
 def reset_tts_system():
@@ -318,9 +337,6 @@ def stop_all_tts_immediately():
     
     print("\033[91mAll TTS stopped immediately!\033[0m")
 
-# Initialize the TTS system when module is imported
-start_tts_queue_system()
-
 # Main execution for testing
 if __name__ == "__main__":
     try:
@@ -1,57 +1,202 @@
 import csv
 import sqlite3
 import os
+import re
+import sys
 
-# Connect to database
-con = sqlite3.connect("jarvis.db")
-cursor = con.cursor()
-
-# Create contacts table
-cursor.execute('''
-    CREATE TABLE IF NOT EXISTS contacts (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        name VARCHAR(200),
-        mobile_no VARCHAR(255),
-        email VARCHAR(255) NULL
-    )
-''')
-
-# -------- Read from CSV and insert into database --------
-with open('contacts.csv', 'r', encoding='utf-8') as csvfile:
-    csvreader = csv.reader(csvfile)
-    for row in csvreader:
-        if len(row) >= 2:  # Make sure we have both name and mobile number
-            name = row[0].strip()
-            mobile_no = row[1].strip()
-            cursor.execute(
-                "INSERT INTO contacts (name, mobile_no, email) VALUES (?, ?, NULL)",
-                (name, mobile_no)
+# Add root dir to Python path (so `Backend` can be found when run as a script)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from Backend.Config import config
+
+
+def resource_path(relative_path):
+    try:
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
+
+
+# Database and import file locations, overridable from .env
+ContactsDB = config.get("ContactsDB") or resource_path("jarvis.db")
+ContactsFile = config.get("ContactsFile") or resource_path("contacts.csv")
+DefaultCountryCode = config.get("DefaultCountryCode").lstrip("+")
+
+
+def NormalizeNumber(number, country_code=DefaultCountryCode):
+    """E.164 form of a phone number (+919876543210), or None if it can't be one"""
+    number = str(number).strip()
+    digits = re.sub(r"\D", "", number)
+
+    if number.startswith("+"):
+        pass
+    elif digits.startswith("00"):
+        digits = digits[2:]
+    elif digits.startswith("0") and len(digits) == 11:
+        # National trunk prefix, e.g. 09876543210
+        digits = country_code + digits[1:]
+    elif len(digits) == 10:
+        digits = country_code + digits
+
+    if not 8 <= len(digits) <= 15:
+        return None
+    return "+" + digits
+
+
+def ensure_schema(con):
+    con.execute('''
+        CREATE TABLE IF NOT EXISTS contacts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name VARCHAR(200),
+            mobile_no VARCHAR(255),
+            email VARCHAR(255) NULL
+        )
+    ''')
+    columns = [row[1] for row in con.execute("PRAGMA table_info(contacts)")]
+    if "e164" in columns:
+        return
+
+    # Older databases: backfill the normalized number and drop the duplicates earlier imports left behind
+    with con:
+        con.execute("ALTER TABLE contacts ADD COLUMN e164 TEXT")
+        rows = con.execute("SELECT id, mobile_no FROM contacts").fetchall()
+        con.executemany(
+            "UPDATE contacts SET e164 = ? WHERE id = ?",
+            ((NormalizeNumber(mobile_no), contact_id) for contact_id, mobile_no in rows)
+        )
+        con.execute('''
+            DELETE FROM contacts WHERE e164 IS NOT NULL AND id NOT IN (
+                SELECT MAX(id) FROM contacts WHERE e164 IS NOT NULL GROUP BY e164
             )
+        ''')
+        con.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_contacts_e164 ON contacts (e164)")
 
-# Commit changes
-con.commit()
 
+def read_csv(path):
+    """Yield (name, number, email) from a CSV of name,number[,email] rows, with or without a header"""
+    with open(path, "r", encoding="utf-8-sig", newline="") as csvfile:
+        rows = csv.reader(csvfile)
+        header = next(rows, None)
+        if header is None:
+            return
 
-# -------- Example search query --------
-query = 'ronie'
-query = query.strip().lower()
+        lowered = [column.strip().lower() for column in header]
+        if "name" in lowered:
+            name_col = lowered.index("name")
+            number_col = next((lowered.index(c) for c in ("mobile_no", "mobile", "phone", "number") if c in lowered), 1)
+            email_col = lowered.index("email") if "email" in lowered else None
+        else:
+            name_col, number_col, email_col = 0, 1, 2
+            rows = [header, *rows]
 
-cursor.execute("SELECT mobile_no FROM contacts WHERE LOWER(name) LIKE ? OR LOWER(name) LIKE ?", 
-               ('%' + query + '%', query + '%'))
-results = cursor.fetchall()
+        for row in rows:
+            if len(row) > max(name_col, number_col):
+                email = row[email_col].strip() if email_col is not None and len(row) > email_col else ""
+                yield row[name_col].strip(), row[number_col].strip(), email or None
 
-if results:
-    print("Mobile number:", results[0][0])
-else:
-    print("Contact not found.")
 
-# Close connection
+def read_vcard(path):
+    """Yield (name, number, email) for every phone number in a .vcf file"""
+    with open(path, "r", encoding="utf-8-sig") as file:
+        text = file.read()
 
+    # Unfold continuation lines (RFC 6350: a line starting with a space or tab continues the previous one)
+    text = re.sub(r"\r?\n[ \t]", "", text)
 
-# delete contacts all -------------------
-# cursor.execute("DELETE FROM contacts")
-# con.commit()
-# print("✅ All contacts deleted.")
+    card = None
+    for line in text.splitlines():
+        if line.upper() == "BEGIN:VCARD":
+            card = {"fn": "", "n": "", "tel": [], "email": None}
+            continue
+        if card is None or ":" not in line:
+            continue
+        if line.upper() == "END:VCARD":
+            name = card["fn"] or " ".join(part for part in reversed(card["n"].split(";")[:2]) if part)
+            for number in card["tel"]:
+                yield name.strip(), number.strip(), card["email"]
+            card = None
+            continue
 
+        key, value = line.split(":", 1)
+        # Drop parameters (TEL;TYPE=CELL) and group prefixes (item1.TEL)
+        prop = key.split(";")[0].split(".")[-1].upper()
+        if prop == "FN":
+            card["fn"] = value
+        elif prop == "N":
+            card["n"] = value
+        elif prop == "TEL":
+            card["tel"].append(value.removeprefix("tel:"))
+        elif prop == "EMAIL" and card["email"] is None:
+            card["email"] = value
 
-con.close()
\ No newline at end of file
+
+def read_contacts(path):
+    if path.lower().endswith((".vcf", ".vcard")):
+        return read_vcard(path)
+    return read_csv(path)
+
+
+def ImportContacts(path=ContactsFile, db_path=ContactsDB, remove_missing=False):
+    """Import a CSV or vCard file into the contacts table.
+
+    Contacts are keyed by their E.164 number, so re-running an import is safe:
+    new numbers are inserted, rows whose name or email changed are updated and
+    everything else is left alone. With remove_missing, contacts that are no
+    longer in the file are deleted. Returns a dict of counts.
+    """
+    contacts = {}
+    skipped = 0
+    for name, number, email in read_contacts(path):
+        e164 = NormalizeNumber(number)
+        if not name or e164 is None:
+            skipped += 1
+            continue
+        # The last entry for a number wins
+        contacts[e164] = (name, email)
+
+    con = sqlite3.connect(db_path)
+    try:
+        ensure_schema(con)
+        existing = {
+            e164: (name, email)
+            for e164, name, email in con.execute("SELECT e164, name, email FROM contacts WHERE e164 IS NOT NULL")
+        }
+
+        new = [(name, e164, email, e164) for e164, (name, email) in contacts.items() if e164 not in existing]
+        changed = [
+            (name, email, e164) for e164, (name, email) in contacts.items()
+            if e164 in existing and existing[e164] != (name, email)
+        ]
+        missing = [(e164,) for e164 in existing if e164 not in contacts] if remove_missing else []
+
+        with con:
+            con.executemany('''
+                INSERT INTO contacts (name, mobile_no, email, e164) VALUES (?, ?, ?, ?)
+                ON CONFLICT (e164) DO UPDATE SET name = excluded.name, email = excluded.email
+            ''', new)
+            con.executemany("UPDATE contacts SET name = ?, email = ? WHERE e164 = ?", changed)
+            con.executemany("DELETE FROM contacts WHERE e164 = ?", missing)
+    finally:
+        con.close()
+
+    return {
+        "inserted": len(new),
+        "updated": len(changed),
+        "deleted": len(missing),
+        "unchanged": len(contacts) - len(new) - len(changed),
+        "skipped": skipped
+    }
+
+
+if __name__ == "__main__":
+    # python Backend/db.py [contacts.csv|contacts.vcf] [jarvis.db] [--remove-missing]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    result = ImportContacts(
+        args[0] if args else ContactsFile,
+        args[1] if len(args) > 1 else ContactsDB,
+        remove_missing="--remove-missing" in sys.argv
+    )
+    print(
+        f"Contacts imported: {result['inserted']} new, {result['updated']} updated, "
+        f"{result['deleted']} removed, {result['unchanged']} unchanged, {result['skipped']} skipped"
+    )
@@ -1,9 +1,8 @@
 import sys
 import os
-from dotenv import dotenv_values
-from PyQt5.QtWidgets import QApplication, QMainWindow, QTextEdit, QStackedWidget, QWidget, QLineEdit, QGridLayout, QVBoxLayout, QHBoxLayout, QPushButton, QFrame, QLabel, QSizePolicy
-from PyQt5.QtGui import QIcon, QPainter, QMovie, QColor, QTextCharFormat, QFont, QPixmap, QTextBlockFormat
-from PyQt5.QtCore import Qt, QSize, QTimer
+from PyQt5.QtWidgets import QApplication, QMainWindow, QStackedWidget, QWidget, QLineEdit, QGridLayout, QVBoxLayout, QHBoxLayout, QPushButton, QFrame, QLabel, QSizePolicy, QListView, QStyledItemDelegate, QAbstractItemView
+from PyQt5.QtGui import QIcon, QPainter, QColor, QFont, QPixmap, QFontMetrics, QImageReader
+from PyQt5.QtCore import Qt, QSize, QRect, QObject, QEvent, QTimer, QFileSystemWatcher, QAbstractListModel, QModelIndex, pyqtSignal
 
 # Helper to get file paths that work in both .py and .exe
 
@@ -14,10 +13,19 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+# Add root dir to Python path (so `Backend` can be found when run on its own)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from Backend.Config import config
+
 # Load environment variables
-env_vars = dotenv_values(resource_path(".env"))
-Assistantname = env_vars.get("Assistantname")
+Assistantname = config.get("Assistantname")
 old_chat_message = ""
+# Messages the chat view keeps in memory, and how many older ones a scroll to the top loads
+ChatWindowSize = config.get("ChatWindowSize")
+ChatPageSize = config.get("ChatPageSize")
+# Animations: LowPowerAnimation shows a still frame; pre-scaled frames may use up to AnimationCacheMB
+LowPowerAnimation = config.get("LowPowerAnimation")
+AnimationCacheMB = config.get("AnimationCacheMB")
 # Set directories with resource_path
 TempDirPath = resource_path("Frontend/Files")
 GraphicsDirPath = resource_path("Frontend/Graphics")
@@ -65,6 +73,7 @@ def GetMicrophoneStatus():
 def SetAssistantStatus(Status):
     with open(TempDictonaryPath("Status.data"), "w", encoding="utf-8") as file:
         file.write(Status)
+    gui_signals.statusChanged.emit(Status)
 
 def GetAssistantStatus():
     with open(TempDictonaryPath("Status.data"), "r", encoding="utf-8") as file:
@@ -79,6 +88,279 @@ def MicButtonClosed():
 def ShowTextToScreen(Text):
     with open(TempDictonaryPath("Responses.data"), "w", encoding="utf-8") as file:
         file.write(Text)
+    gui_signals.responseChanged.emit(Text)
+
+class GuiSignals(QObject):
+    # Emitted from backend threads; Qt queues the call onto the GUI thread
+    imageReady = pyqtSignal(str)
+    responseChanged = pyqtSignal(str)
+    statusChanged = pyqtSignal(str)
+    settingsChanged = pyqtSignal()
+
+gui_signals = GuiSignals()
+
+def ApplySettings(changes):
+    """Assistant name, chat paging and animation settings from a saved .env; the window itself stays up"""
+    global Assistantname, ChatWindowSize, ChatPageSize, LowPowerAnimation, AnimationCacheMB
+
+    Assistantname = config.get("Assistantname")
+    ChatWindowSize = config.get("ChatWindowSize")
+    ChatPageSize = config.get("ChatPageSize")
+    LowPowerAnimation = config.get("LowPowerAnimation")
+    AnimationCacheMB = config.get("AnimationCacheMB")
+    gui_signals.settingsChanged.emit()
+
+config.subscribe(("Assistantname", "ChatWindowSize", "ChatPageSize", "LowPowerAnimation", "AnimationCacheMB"), ApplySettings)
+
+def ReadDataFile(Filename):
+    try:
+        with open(TempDictonaryPath(Filename), "r", encoding="utf-8") as file:
+            return file.read()
+    except OSError:
+        return ""
+
+def OnDataFileChanged(path):
+    # Writers outside this module (e.g. SpeechToText) only touch the files, so forward those changes too
+    if path not in data_file_watcher.files() and os.path.exists(path):
+        data_file_watcher.addPath(path)
+    Filename = os.path.basename(path)
+    if Filename == "Responses.data":
+        gui_signals.responseChanged.emit(ReadDataFile(Filename))
+    elif Filename == "Status.data":
+        gui_signals.statusChanged.emit(ReadDataFile(Filename))
+
+data_file_watcher = None
+
+def WatchDataFiles():
+    """Watch Responses.data and Status.data; needs a running QApplication"""
+    global data_file_watcher
+    data_file_watcher = QFileSystemWatcher([TempDictonaryPath("Responses.data"), TempDictonaryPath("Status.data")])
+    data_file_watcher.fileChanged.connect(OnDataFileChanged)
+
+def ShowImageOnScreen(ImagePath):
+    gui_signals.imageReady.emit(str(ImagePath))
+
+chat_history_loader = None
+chat_history_position = None
+
+def SetChatHistoryLoader(loader, position=None):
+    """loader(before, count) returns up to count [(position, text)] history messages, oldest first,
+    with position < before (the newest ones if before is None); positions grow with message age order.
+    position() gives the position a message saved now would get, so live messages can page too."""
+    global chat_history_loader, chat_history_position
+    chat_history_loader = loader
+    chat_history_position = position
+
+class GifFrames:
+    """GIF frames shared by every AnimatedLabel, decoded and scaled as they are first shown.
+
+    Nothing is decoded up front: a label's first paint costs one frame, and the
+    rest follow as the animation reaches them. Frames scaled to a given size are
+    kept as pixmaps while they fit in AnimationCacheMB; past that they are scaled
+    again each time from the shared decoded images.
+    """
+
+    decoded = {}
+    scaled = {}
+    scaled_bytes = 0
+
+    @classmethod
+    def source(cls, path):
+        if path not in cls.decoded:
+            reader = QImageReader(path)
+            cls.decoded[path] = {"reader": reader, "frames": [], "delays": [], "count": reader.imageCount()}
+        return cls.decoded[path]
+
+    @classmethod
+    def decodeUpTo(cls, path, number):
+        """Decode frames in order until frame number is available (or the file ends)"""
+        source = cls.source(path)
+        reader = source["reader"]
+        while len(source["frames"]) <= number and reader.canRead():
+            image = reader.read()
+            if image.isNull():
+                break
+            source["frames"].append(image)
+            source["delays"].append(max(reader.nextImageDelay(), 20))
+        if not reader.canRead():
+            # The header's frame count may be missing or wrong; what could be read is what there is
+            source["count"] = len(source["frames"])
+        return source
+
+    @classmethod
+    def frameCount(cls, path):
+        source = cls.source(path)
+        if source["count"] <= 0:
+            cls.decodeUpTo(path, float("inf"))
+        return source["count"]
+
+    @classmethod
+    def delay(cls, path, number):
+        source = cls.decodeUpTo(path, number)
+        return source["delays"][number] if number < len(source["delays"]) else 100
+
+    @classmethod
+    def pixmap(cls, path, number, size):
+        """Frame number of path scaled to size, or None if the file has no such frame"""
+        source = cls.decodeUpTo(path, number)
+        if number >= len(source["frames"]):
+            return None
+
+        key = (path, size.width(), size.height())
+        pixmaps = cls.scaled.setdefault(key, {})
+        if number in pixmaps:
+            return pixmaps[number]
+
+        pixmap = cls.scale(source["frames"][number], size)
+        needed = size.width() * size.height() * 4
+        if cls.scaled_bytes + needed <= AnimationCacheMB * 1024 * 1024:
+            pixmaps[number] = pixmap
+            cls.scaled_bytes += needed
+        return pixmap
+
+    @staticmethod
+    def scale(image, size):
+        return QPixmap.fromImage(image.scaled(size, Qt.IgnoreAspectRatio, Qt.SmoothTransformation))
+
+class AnimatedLabel(QLabel):
+    """QLabel playing a GIF from GifFrames; stops while hidden or minimized, still in low-power mode"""
+
+    def __init__(self, path, size, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.frame_size = size
+        self.frame = 0
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.nextFrame)
+        self.watched_window = None
+        # LowPowerAnimation may be switched off while we're on screen
+        gui_signals.settingsChanged.connect(self.play)
+        self.showFrame(0)
+
+    def frameCount(self):
+        return GifFrames.frameCount(self.path)
+
+    def showFrame(self, number):
+        count = self.frameCount()
+        if not count:
+            return
+        self.frame = number % count
+        pixmap = GifFrames.pixmap(self.path, self.frame, self.frame_size)
+        if pixmap is not None:
+            self.setPixmap(pixmap)
+
+    def nextFrame(self):
+        if LowPowerAnimation or not self.isVisible() or self.window().isMinimized():
+            return
+        self.showFrame(self.frame + 1)
+        self.timer.start(GifFrames.delay(self.path, self.frame))
+
+    def play(self):
+        if LowPowerAnimation or self.frameCount() < 2 or self.timer.isActive() or not self.isVisible():
+            return
+        self.timer.start(GifFrames.delay(self.path, self.frame))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        window = self.window()
+        if window is not self.watched_window:
+            window.installEventFilter(self)
+            self.watched_window = window
+        self.play()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def eventFilter(self, obj, event):
+        if obj is self.watched_window and event.type() == QEvent.WindowStateChange:
+            if obj.isMinimized():
+                self.timer.stop()
+            elif self.isVisible():
+                self.play()
+        return False
+
+class ChatModel(QAbstractListModel):
+    """The messages currently in the chat view, at most ChatWindowSize of them.
+
+    Each row is (history position or None, text, color); a live message gets the
+    position history had reached when it was shown. Appending past the limit
+    drops the oldest rows; loading an older page past the limit drops the
+    newest, which come back from history once the view returns to the bottom.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.newest_trimmed = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        _, text, color = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.ForegroundRole:
+            return QColor(color)
+        return None
+
+    def oldestIndex(self):
+        indexes = [row[0] for row in self.rows if row[0] is not None]
+        return min(indexes) if indexes else None
+
+    def append(self, text, color, history_index=None):
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows))
+        self.rows.append((history_index, text, color))
+        self.endInsertRows()
+        extra = len(self.rows) - ChatWindowSize
+        if extra > 0:
+            self.beginRemoveRows(QModelIndex(), 0, extra - 1)
+            del self.rows[:extra]
+            self.endRemoveRows()
+
+    def prepend(self, messages, color):
+        if not messages:
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(messages) - 1)
+        self.rows[:0] = [(index, text, color) for index, text in messages]
+        self.endInsertRows()
+        extra = len(self.rows) - ChatWindowSize
+        if extra > 0:
+            self.beginRemoveRows(QModelIndex(), len(self.rows) - extra, len(self.rows) - 1)
+            del self.rows[-extra:]
+            self.endRemoveRows()
+            self.newest_trimmed = True
+
+    def reset(self, messages, color):
+        self.beginResetModel()
+        self.rows = [(index, text, color) for index, text in messages]
+        self.newest_trimmed = False
+        self.endResetModel()
+
+class ChatDelegate(QStyledItemDelegate):
+    """Paints one message as word-wrapped text; only visible rows are ever painted"""
+
+    Margin = 10
+
+    def textRect(self, option):
+        return option.rect.adjusted(self.Margin, self.Margin, -self.Margin, 0)
+
+    def sizeHint(self, option, index):
+        width = max(option.rect.width(), option.widget.viewport().width() if option.widget else 0) - 2 * self.Margin
+        metrics = QFontMetrics(option.font)
+        bounds = metrics.boundingRect(QRect(0, 0, max(width, 1), 100000), Qt.TextWordWrap, index.data(Qt.DisplayRole))
+        return QSize(width, bounds.height() + self.Margin)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setFont(option.font)
+        painter.setPen(index.data(Qt.ForegroundRole) or QColor(Qt.white))
+        painter.drawText(self.textRect(option), Qt.TextWordWrap, index.data(Qt.DisplayRole))
+        painter.restore()
 
 class ChatSection(QWidget):
 
@@ -87,28 +369,35 @@ class ChatSection(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(-10, 40, 40, 100)
         layout.setSpacing(-100)
-        self.chat_text_edit = QTextEdit()
-        self.chat_text_edit.setReadOnly(True)
-        self.chat_text_edit.setTextInteractionFlags(Qt.NoTextInteraction)   # No text interaction
-        self.chat_text_edit.setFrameStyle(QFrame.NoFrame)
-        layout.addWidget(self.chat_text_edit)
+        self.chat_model = ChatModel(self)
+        self.chat_list = QListView()
+        self.chat_list.setModel(self.chat_model)
+        self.chat_list.setItemDelegate(ChatDelegate(self.chat_list))
+        self.chat_list.setSelectionMode(QAbstractItemView.NoSelection)
+        self.chat_list.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.chat_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.chat_list.setResizeMode(QListView.Adjust)
+        self.chat_list.setWordWrap(True)
+        self.chat_list.setFrameStyle(QFrame.NoFrame)
+        self.chat_list.verticalScrollBar().valueChanged.connect(self.onScroll)
+        layout.addWidget(self.chat_list)
         self.setStyleSheet("background-color: black;")
         layout.setSizeConstraint(QVBoxLayout.SetDefaultConstraint)
         layout.setStretch(1, 1)
         self.setSizePolicy(QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding))
-        text_color = QColor(Qt.blue)
-        text_color_text = QTextCharFormat()
-        text_color_text.setForeground(text_color)
-        self.chat_text_edit.setCurrentCharFormat(text_color_text)
-        self.gif_label = QLabel()
-        self.gif_label.setStyleSheet("border: none;")
-        movie = QMovie(GraphicsDictonaryPath("Jarvis.gif"))
+        self.gallery = QWidget()
+        self.gallery_layout = QHBoxLayout(self.gallery)
+        self.gallery_layout.setContentsMargins(10, 0, 10, 0)
+        self.gallery_layout.setAlignment(Qt.AlignLeft)
+        self.gallery.setStyleSheet("border: none;")
+        self.gallery.hide()
+        layout.addWidget(self.gallery)
+        gui_signals.imageReady.connect(self.addImage)
         max_gif_size_W = 480
         max_gif_size_H = 270
-        movie.setScaledSize(QSize(max_gif_size_W, max_gif_size_H))
+        self.gif_label = AnimatedLabel(GraphicsDictonaryPath("Jarvis.gif"), QSize(max_gif_size_W, max_gif_size_H))
+        self.gif_label.setStyleSheet("border: none;")
         self.gif_label.setAlignment(Qt.AlignRight | Qt.AlignBottom)
-        self.gif_label.setMovie(movie)
-        movie.start()
         layout.addWidget(self.gif_label)
         self.label = QLabel("")
         self.label.setStyleSheet("color: white; font-size: 16px; margin-right: 195px; border: none; margin-top: -30px;")
@@ -118,12 +407,18 @@ class ChatSection(QWidget):
         layout.addWidget(self.gif_label)
         font = QFont()
         font.setPointSize(13)
-        self.chat_text_edit.setFont(font)
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.loadMessages)
-        self.timer.timeout.connect(self.SpeechRecogText)
-        self.timer.start(5)
-        self.chat_text_edit.viewport().installEventFilter(self)
+        self.chat_list.setFont(font)
+        gui_signals.responseChanged.connect(self.showResponse)
+        gui_signals.statusChanged.connect(self.SpeechRecogText)
+        if chat_history_loader is not None:
+            self.loadLatestHistory()
+        if self.chat_model.rowCount():
+            # Start from the newest page of history; what's already in Responses.data is part of it
+            global old_chat_message
+            old_chat_message = ReadDataFile("Responses.data")
+        else:
+            self.loadMessages()
+        self.SpeechRecogText(ReadDataFile("Status.data"))
         self.setStyleSheet("""
                 QScrollBar:vertical {
                     border: none;
@@ -163,28 +458,27 @@ class ChatSection(QWidget):
             """)
 
     def loadMessages(self):
+        self.showResponse(ReadDataFile("Responses.data"))
+
+    def showResponse(self, messages):
         
         global old_chat_message
 
-        with open(TempDirectoryPath("Responses.data"), "r", encoding="utf-8") as file:
-            messages = file.read()
+        if None == messages:
+            pass
 
-            if None == messages:
-                pass
+        elif len(messages) <= 1:
+            pass
 
-            elif len(messages) <= 1:
-                pass
+        elif str(old_chat_message)==str(messages):
+            pass
 
-            elif str(old_chat_message)==str(messages):
-                pass
-
-            else:
-                self.addMessage(message=messages, color="White")
-                old_chat_message = messages
+        else:
+            self.addMessage(message=messages, color="White")
+            old_chat_message = messages
 
-    def SpeechRecogText(self):
-        with open(TempDirectoryPath("Status.data"), "r", encoding="utf-8") as file:
-            messages = file.read()
+    def SpeechRecogText(self, messages):
+        if messages != self.label.text():
             self.label.setText(messages)
 
     def load_icon(self, path, width=60, height=60):
@@ -204,17 +498,59 @@ class ChatSection(QWidget):
 
         self.toggled = not self.toggled
 
+    def addImage(self, path, max_images=8, size=200):
+        # Generated image previews show up one by one as they land, newest on the right
+        pixmap = QPixmap(path)
+        if pixmap.isNull():
+            return
+        image_label = QLabel()
+        image_label.setPixmap(pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        image_label.setToolTip(path)
+        self.gallery_layout.addWidget(image_label)
+        while self.gallery_layout.count() > max_images:
+            oldest = self.gallery_layout.takeAt(0).widget()
+            if oldest:
+                oldest.deleteLater()
+        self.gallery.show()
+
     def addMessage(self, message, color):
-        cursor = self.chat_text_edit.textCursor()
-        format = QTextCharFormat()
-        formatm = QTextBlockFormat()
-        formatm.setTopMargin(10)
-        formatm.setLeftMargin(10)
-        format.setForeground(QColor(color))
-        cursor.setCharFormat(format)
-        cursor.setBlockFormat(formatm)
-        cursor.insertText(message + "\n")
-        self.chat_text_edit.setTextCursor(cursor)
+        scrollbar = self.chat_list.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 5
+        # Older pages are read from here once this message is the oldest one in the view
+        position = chat_history_position() if chat_history_position else None
+        self.chat_model.append(message, color, position)
+        if at_bottom:
+            self.chat_list.scrollToBottom()
+
+    def loadLatestHistory(self):
+        self.chat_model.reset(chat_history_loader(None, ChatPageSize), "White")
+        self.chat_list.scrollToBottom()
+
+    def loadOlderHistory(self):
+        before = self.chat_model.oldestIndex()
+        if before is None or before <= 0:
+            return
+        messages = chat_history_loader(before, ChatPageSize)
+        # A live answer is saved before it is shown, so its own position already includes it
+        if messages and self.chat_model.rows and messages[-1][1] == self.chat_model.rows[0][1]:
+            messages = messages[:-1]
+        if not messages:
+            return
+        # Keep the message that was on top where it is on screen
+        scrollbar = self.chat_list.verticalScrollBar()
+        old_maximum = scrollbar.maximum()
+        self.chat_model.prepend(messages, "White")
+        self.chat_list.doItemsLayout()
+        scrollbar.setValue(scrollbar.value() + scrollbar.maximum() - old_maximum)
+
+    def onScroll(self, value):
+        if chat_history_loader is None:
+            return
+        scrollbar = self.chat_list.verticalScrollBar()
+        if value == scrollbar.minimum() and scrollbar.maximum() > 0:
+            self.loadOlderHistory()
+        elif value == scrollbar.maximum() and self.chat_model.newest_trimmed:
+            self.loadLatestHistory()
 
 class InitialScreen(QWidget):
 
@@ -225,13 +561,9 @@ class InitialScreen(QWidget):
         screen_height = desktop.screenGeometry().height()
         content_layout = QVBoxLayout()
         content_layout.setContentsMargins(0, 0, 0, 0)
-        gif_label = QLabel()
-        movie = QMovie(GraphicsDictonaryPath("Jarvis.gif"))
-        gif_label.setMovie(movie)
         max_gif_size_H = int(screen_width / 16 * 9)
-        movie.setScaledSize(QSize(screen_width, max_gif_size_H))
+        gif_label = AnimatedLabel(GraphicsDictonaryPath("Jarvis.gif"), QSize(screen_width, max_gif_size_H))
         gif_label.setAlignment(Qt.AlignCenter)
-        movie.start()
         gif_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.icon_label = QLabel()
         pixmap = QPixmap(GraphicsDictonaryPath("Mic_on.png"))
@@ -252,13 +584,11 @@ class InitialScreen(QWidget):
         self.setFixedHeight(screen_height)
         self.setFixedWidth(screen_width)
         self.setStyleSheet("background-color: black;")
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.SpeechRecogText)
-        self.timer.start(5)
+        gui_signals.statusChanged.connect(self.SpeechRecogText)
+        self.SpeechRecogText(ReadDataFile("Status.data"))
 
-    def SpeechRecogText(self):
-        with open(TempDirectoryPath("Status.data"), "r", encoding="utf-8") as file:
-            messages = file.read()
+    def SpeechRecogText(self, messages):
+        if messages != self.label.text():
             self.label.setText(messages)
 
     def load_icon(self, path, width=60, height=60):
@@ -339,11 +669,14 @@ class CustomTopBar(QWidget):
         line_frame.setFrameShape(QFrame.HLine)
         line_frame.setFrameShadow(QFrame.Sunken)
         line_frame.setStyleSheet("border-color: black;")
-        title_label = QLabel(f" {str(Assistantname).capitalize()}  AI  ")
-        title_label.setStyleSheet("color: black; font-size: 18px;; background-color: white")
+        self.title_label = QLabel()
+        self.title_label.setStyleSheet("color: black; font-size: 18px;; background-color: white")
+        self.updateTitle()
+        # A renamed assistant shows up in the title without a restart
+        gui_signals.settingsChanged.connect(self.updateTitle)
         home_button.clicked.connect(lambda: self.stack_widget.setCurrentIndex(0))
         message_button.clicked.connect(lambda: self.stack_widget.setCurrentIndex(1))
-        layout.addWidget(title_label)
+        layout.addWidget(self.title_label)
         layout.addStretch(1)
         layout.addWidget(home_button)
         layout.addWidget(message_button)
@@ -355,6 +688,9 @@ class CustomTopBar(QWidget):
         self.draggable = True
         self.offset = None
     
+    def updateTitle(self):
+        self.title_label.setText(f" {str(Assistantname).capitalize()}  AI  ")
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.fillRect(self.rect(), Qt.white)
@@ -425,10 +761,14 @@ class MainWindow(QMainWindow):
         self.setMenuWidget(top_bar)
         self.setCentralWidget(stacked_widget)
 
-def GraphicalUserInterface():
+def GraphicalUserInterface(on_ready=None):
     app = QApplication(sys.argv)
+    WatchDataFiles()
     window = MainWindow()
     window.show()
+    if on_ready:
+        # Queued behind the first paint, so it runs once the window is actually up
+        QTimer.singleShot(0, on_ready)
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
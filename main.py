@@ -1,4 +1,10 @@
 #jarvis my file
+from Backend.Startup import StartProfiling, MarkStartup, FinishStartup, LazyFunction, WarmUp
+
+if __name__ == "__main__":
+    # Time everything up to the first interactive frame; the image worker re-imports this file and skips it
+    StartProfiling()
+
 from Frontend.GUI import (
     GraphicalUserInterface,
     SetAssistantStatus,
@@ -8,29 +14,25 @@ from Frontend.GUI import (
     AnswerModifier,
     QueryModifier,
     GetMicrophoneStatus,
-    GetAssistantStatus)
-from Backend.ImageGeneration import ProcessImageRequestFromDataFile, stop_image_generation_immediately, reset_image_generation
-from Backend.Model import FirstLayerDMM
-from Backend.RealtimeSearchEngine import RealtimeSearchEngine
-from Backend.Automation import Automation
-from Backend.SpeechToText import StartContinuousListening, StopContinuousListening, CleanupWebDriver, analyze_stop_command
-from Backend.Chatbot import ChatBot
-from Backend.TextToSpeech import TextToSpeech, reset_tts_system, stop_all_tts_immediately
-from dotenv import dotenv_values
+    GetAssistantStatus,
+    ShowImageOnScreen,
+    SetChatHistoryLoader)
+from Backend.ImageWorker import SubmitImageJob, CancelAllImageJobs, StopImageWorker, DONE, FAILED
+from Backend.ChatHistory import ReadChatPage
+from Backend.Commands import IsTask
+from Backend.Reminders import StartReminders, StopReminders
+from Backend.Config import config
 from asyncio import run
 from time import sleep
 import subprocess
 import sys
 import threading
-import json
 import os
+import multiprocessing
 
 import sys
 import os
 
-# Start with greeting
-threading.Thread(target=TextToSpeech, args=("Hello Sir! All systems active and alive! What can I assist you with today?",)).start()
-
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
     try:
@@ -40,68 +42,79 @@ def resource_path(relative_path):
 
     return os.path.join(base_path, relative_path)
 
-env_vars = dotenv_values(resource_path(".env"))
-
-Username = env_vars.get("Username")
-Assistantname = env_vars.get("Assistantname")
-DefaultMessage = f'''{Username} : Hello {Assistantname}! How are you?
+Username = config.get("Username")
+Assistantname = config.get("Assistantname")
+DefaultMessage = '''{Username} : Hello {Assistantname}! How are you?
 {Assistantname} : Hello {Username} I'm doing well, how can I help you today?
 '''
+
+def ApplySettings(changes):
+    global Username, Assistantname
+    Username = config.get("Username")
+    Assistantname = config.get("Assistantname")
+
+config.subscribe(("Username", "Assistantname"), ApplySettings)
 subprocesses = []
-Functions = ["open", "close", "play", "system", "content", "google search", "youtube search" , "send message" , "whatsapp call" , "video call"]
+
+# The backends import selenium, pygame, pyautogui, AppOpener and the API clients and set
+# themselves up on import, so they load on first use (or in WarmUp once the window is up)
+FirstLayerDMM = LazyFunction("Backend.Model:FirstLayerDMM")
+RealtimeSearchEngine = LazyFunction("Backend.RealtimeSearchEngine:RealtimeSearchEngine")
+Automation = LazyFunction("Backend.Automation:Automation")
+StartContinuousListening = LazyFunction("Backend.SpeechToText:StartContinuousListening")
+StopContinuousListening = LazyFunction("Backend.SpeechToText:StopContinuousListening")
+CleanupWebDriver = LazyFunction("Backend.SpeechToText:CleanupWebDriver")
+analyze_stop_command = LazyFunction("Backend.SpeechToText:analyze_stop_command")
+ChatBot = LazyFunction("Backend.Chatbot:ChatBot")
+TextToSpeech = LazyFunction("Backend.TextToSpeech:TextToSpeech")
+reset_tts_system = LazyFunction("Backend.TextToSpeech:reset_tts_system")
+stop_all_tts_immediately = LazyFunction("Backend.TextToSpeech:stop_all_tts_immediately")
+# Most needed first: speech out, then the decision model and answers, then the rest
+WarmUpModules = [
+    "Backend.TextToSpeech",
+    "Backend.Model",
+    "Backend.Chatbot",
+    "Backend.RealtimeSearchEngine",
+    "Backend.SpeechToText",
+    "Backend.Automation",
+]
 
 # Global variables for continuous listening
 continuous_listening_thread = None
 listening_active = False
 
-def ShowDefaultChatIfNoChats():
-    File = open(resource_path(r"Data\ChatLog.json"), "r", encoding="utf-8")
-    if len(File.read()) < 5:
-        with open(TempDictonaryPath("Database.data"), "w", encoding="utf-8") as file:
-            file.write("")
+ChatLogPath = resource_path(r"Data\ChatLog.json")
 
+def ShowDefaultChatIfNoChats():
+    if not os.path.exists(ChatLogPath) or os.path.getsize(ChatLogPath) < 5:
         with open(TempDictonaryPath("Responses.data"), "w", encoding="utf-8") as file:
-            file.write(DefaultMessage)
-
-def ReadChatLogJson():
-    with open(resource_path(r"Data\ChatLog.json"), "r", encoding="utf-8") as file:
-        chatlog_data = json.load(file)
-    return chatlog_data
+            file.write(DefaultMessage.format(Username=Username, Assistantname=Assistantname))
+
+def LoadChatHistory(before, count):
+    """Chat view page: up to count ChatLog.json messages before offset before (newest if None)"""
+    names = {"user": Username, "assistant": Assistantname}
+    return [
+        (offset, f"{names[entry['role']]} : {AnswerModifier(entry['content'])}")
+        for offset, entry in ReadChatPage(ChatLogPath, before, count)
+        if entry.get("role") in names
+    ]
+
+def ChatLogPosition():
+    """Offset the next message saved to ChatLog.json will start at"""
+    try:
+        return os.path.getsize(ChatLogPath)
+    except OSError:
+        return 0
 
 def ChatLogIntegration():
-    json_data = ReadChatLogJson()
-    formatted_chatlog = ""
-
-    for entry in json_data:
-        if entry["role"] == "user":
-            formatted_chatlog += f"User: {entry['content']}\n"
-        elif entry["role"] == "assistant":
-            formatted_chatlog += f"Assistant: {entry['content']}\n"
-
-    formatted_chatlog = formatted_chatlog.replace("User", Username + " ")
-    formatted_chatlog = formatted_chatlog.replace("Assistant", Assistantname + " ")
-
-    with open(TempDictonaryPath("Database.data"), "w", encoding="utf-8") as file:
-        file.write(AnswerModifier(formatted_chatlog))
-
-def ShowChatsOnGUI():
-    File = open(TempDictonaryPath("Database.data"), "r", encoding="utf-8")
-    Data = File.read()
-
-    if len(str(Data)) > 0:
-        lines = Data.split("\n")
-        result = '\n'.join(lines)
-        File.close()
-        File = open(TempDictonaryPath("Responses.data"), "w", encoding="utf-8")
-        File.write(result)
-        File.close()
+    # The chat view pulls the last page of the log itself and older pages as it scrolls up
+    SetChatHistoryLoader(LoadChatHistory, ChatLogPosition)
 
 def InitialExecution():
     SetMicrophoneStatus("False")
     ShowTextToScreen("")
     ShowDefaultChatIfNoChats()
     ChatLogIntegration()
-    ShowChatsOnGUI()
 
 def ReadInputFile():
     """Read the current content from Data/input.txt"""
@@ -143,11 +156,29 @@ def StopContinuousListeningThread():
         StopContinuousListening()
         print("\033[93mContinuous listening thread stopped\033[0m")
 
+def OnImageJobFinished(job):
+    """Report a finished background image job"""
+    print(f"\033[94mImage job {job['job_id']} {job['status']}: {len(job['results'])} images\033[0m")
+
+    if job["status"] == DONE and job["results"]:
+        TextToSpeech("Your images are ready, sir!")
+    elif job["status"] == DONE:
+        TextToSpeech("Facing error while Generating Images , Sir!")
+    elif job["status"] == FAILED:
+        ShowTextToScreen(f"{Assistantname} : Image generation failed - {job['error']}")
+        TextToSpeech("Facing error while Generating Images , Sir!")
+
+def OnReminderDue(reminder):
+    """Announce a reminder that has come due"""
+    ShowTextToScreen(f"{Assistantname} : Reminder - {reminder['message']}")
+    TextToSpeech(f"Sir, this is your reminder: {reminder['message']}")
+
 def MainExecution():
     """Main execution function that processes queries"""
     TaskExecution = False
     ImageExecution = False
     ImageGenerationQuery = ""
+    ImageRefresh = False
 
     # Read query from input file
     Query = ReadInputFile()
@@ -159,7 +190,7 @@ def MainExecution():
     if Query == "STOP_COMMAND_FOR_ASSISTANT":
         print("\033[91mStop command detected - stopping all operations and clearing input\033[0m")
         stop_all_tts_immediately()
-        stop_image_generation_immediately()
+        CancelAllImageJobs()
         ClearInputFile()
         return False
     
@@ -167,16 +198,15 @@ def MainExecution():
     if 'stop' in Query.lower() and analyze_stop_command(Query):
         print(f"\033[91mIntelligent stop command detected: '{Query}' - stopping all operations and clearing input\033[0m")
         stop_all_tts_immediately()
-        stop_image_generation_immediately()
+        CancelAllImageJobs()
         ClearInputFile()
         return False
     
     # Clear the input file since we're processing this query
     ClearInputFile()
     
-    # Reset TTS and image generation systems for new interaction
+    # Reset TTS system for new interaction
     reset_tts_system()
-    reset_image_generation()
     
     ShowTextToScreen(f"{Username} : {Query}")
     SetAssistantStatus("Thinking...")
@@ -197,20 +227,20 @@ def MainExecution():
         if "generate " in queries:
             ImageGenerationQuery = str(queries)
             ImageExecution = True
+            # "regenerate image ..." skips the cached images of the same prompt
+            ImageRefresh = ImageGenerationQuery.startswith("regenerate ")
+            if ImageRefresh:
+                ImageGenerationQuery = ImageGenerationQuery.removeprefix("re")
         
-    for queries in Decision:
-        if TaskExecution == False:
-            if any(queries.startswith(func) for func in Functions):
-                run(Automation(list(Decision)))
-                TaskExecution = True
+    if any(IsTask(queries) for queries in Decision):
+        run(Automation(list(Decision)))
+        TaskExecution = True
 
     if ImageExecution:
-        with open(resource_path(r"Frontend/Files/ImageGeneration.data"), "w") as file:
-            file.write(f"{ImageGenerationQuery},True")
-
+        # Image jobs run in the background worker process while we keep answering
         try:
             TextToSpeech("Generating Images sir! might take a moment...")
-            ProcessImageRequestFromDataFile()
+            SubmitImageJob(ImageGenerationQuery, refresh=ImageRefresh, callback=OnImageJobFinished, on_image=ShowImageOnScreen)
         except Exception as e:
             TextToSpeech("Facing error while Generating Images , Sir!")
             print(f"Error Generating Image: {e}")
@@ -282,14 +312,31 @@ def FirstThread():
             else:
                 SetAssistantStatus("Available...")
 
+def OnWindowReady():
+    """Runs on the GUI thread once the window is up and taking input"""
+    MarkStartup("window shown")
+    FinishStartup()
+
+    # Start with greeting
+    threading.Thread(target=TextToSpeech, args=("Hello Sir! All systems active and alive! What can I assist you with today?",)).start()
+    WarmUp(WarmUpModules)
+
 def SecondThread():
     """GUI thread"""
-    GraphicalUserInterface()
-
-# Initialize the system
-InitialExecution()
+    GraphicalUserInterface(on_ready=OnWindowReady)
 
 if __name__ == "__main__":
+    # Lets the image worker process start from a frozen (PyInstaller) build
+    multiprocessing.freeze_support()
+    MarkStartup("imports")
+
+    # Initialize the system
+    InitialExecution()
+    StartReminders(OnReminderDue)
+    # Saving .env applies voice, model and language changes to the running assistant
+    config.watch()
+    MarkStartup("initial execution")
+
     try:
         thread2 = threading.Thread(target=FirstThread, daemon=True)
         thread2.start()
@@ -297,8 +344,12 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         print("\nShutting down...")
         StopContinuousListeningThread()
-        CleanupWebDriver()
+        if CleanupWebDriver.loaded:
+            CleanupWebDriver()
     finally:
-        # Cleanup on exit
+        # Cleanup on exit; a backend that never loaded has nothing to clean up
         StopContinuousListeningThread()
-        CleanupWebDriver()
\ No newline at end of file
+        if CleanupWebDriver.loaded:
+            CleanupWebDriver()
+        StopImageWorker()
+        StopReminders()
\ No newline at end of file